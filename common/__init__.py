@@ -1,2 +1,21 @@
-from .bitsPacket import BITSPacket
+from importlib import import_module
+
+# `timer` is also the name of its submodule, so it has to be bound eagerly.
 from .timer import timer
+from .lazy import lazy_import
+
+# The rest is only imported when first used, to keep startup cheap:
+_lazy = {
+    "BITSPacket": ".bitsPacket",
+    "PacketArrays": ".bitsArrays",
+    "cached_parser": ".cache",
+}
+
+
+def __getattr__(name):
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_lazy[name], __name__), name)
+    globals()[name] = value
+    return value
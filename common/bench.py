@@ -0,0 +1,98 @@
+"""
+Benchmarks the tasks of every day: warmup runs, then repeated timed runs,
+reported as JSON.
+
+    python -m common.bench [DAY ...] [--repeat N] [--output FILE]
+    python -m common.bench --baseline FILE [--threshold PERCENT]
+
+With --baseline, exits non-zero if the median of any day/part regressed
+by more than the threshold compared to the saved results.
+"""
+
+from argparse import ArgumentParser, FileType
+from pathlib import Path
+from statistics import median, stdev
+from sys import stdout
+import json
+import sys
+
+from .runner import call_task, select
+from .timer import timer, format_duration
+
+
+def bench_task(root, task, warmup=1, repeat=5):
+    for _ in range(warmup):
+        call_task(root, task)
+
+    times = []
+    for _ in range(repeat):
+        with timer(f"{task.day} {task.name}", report=False) as timing:
+            call_task(root, task)
+        times.append(timing.elapsed)
+
+    return {
+        "min": min(times),
+        "median": median(times),
+        "stddev": stdev(times) if len(times) > 1 else 0.0,
+        "repeat": repeat,
+    }
+
+
+def bench(root, tasks, warmup=1, repeat=5):
+    results = {}
+    for task in tasks:
+        stats = bench_task(root, task, warmup, repeat)
+        results.setdefault(task.day, {})[task.name] = stats
+        print(
+            f"{task.day:>5} {task.name}: "
+            f"min {format_duration(stats['min'])}, "
+            f"median {format_duration(stats['median'])}, "
+            f"stddev {format_duration(stats['stddev'])}",
+            file=sys.stderr,
+        )
+    return results
+
+
+def regressions(results, baseline, threshold):
+    """Yields (day, part, percentage) for every median that got slower than allowed."""
+    for day, parts in results.items():
+        for part, stats in parts.items():
+            try:
+                before = baseline[day][part]["median"]
+            except KeyError:
+                continue
+
+            change = (stats["median"] - before) / before * 100
+            if change > threshold:
+                yield day, part, change
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("days", nargs="*", metavar="DAY")
+    opts.add_argument("--root", default=".", type=Path)
+    opts.add_argument("--warmup", default=1, type=int)
+    opts.add_argument("--repeat", "-n", default=5, type=int)
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--baseline", "-b", type=FileType("r"))
+    opts.add_argument("--threshold", "-t", default=10.0, type=float, metavar="PERCENT")
+    return opts.parse_args()
+
+
+def main():
+    opts = getopts()
+    results = bench(opts.root, select(opts.days), opts.warmup, opts.repeat)
+    json.dump(results, opts.output, indent=2)
+    print(file=opts.output)
+
+    if opts.baseline is None:
+        return 0
+
+    slower = list(regressions(results, json.load(opts.baseline), opts.threshold))
+    for day, part, change in slower:
+        print(f"{day} {part}: {change:+.1f}% slower than baseline", file=sys.stderr)
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
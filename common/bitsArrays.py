@@ -0,0 +1,132 @@
+"""
+BITS packet trees as a handful of flat numpy arrays instead of one Python
+object per packet.
+"""
+
+from array import array
+from dataclasses import dataclass, fields
+from functools import cached_property
+
+import numpy as np
+
+from .bitsPacket import BITSPacket, BitReader, Type, OPERATORS, iter_events
+
+
+@dataclass(frozen=True, eq=False)
+class PacketArrays:
+    """
+    One entry per packet, in post-order: sub-packets come before their
+    operator, the outermost packet is last. The sub-packets of packet `i` are
+    `children[child_start[i] : child_start[i] + child_count[i]]`.
+    """
+
+    version: np.ndarray
+    type: np.ndarray
+    # Literal values, 0 for operators. int64, or object if they don't fit.
+    literal: np.ndarray
+    child_start: np.ndarray
+    child_count: np.ndarray
+    children: np.ndarray
+
+    def __len__(self):
+        return len(self.version)
+
+    def __eq__(self, other):
+        if not isinstance(other, PacketArrays):
+            return NotImplemented
+        return all(np.array_equal(getattr(self, f.name), getattr(other, f.name)) for f in fields(self))
+
+    @classmethod
+    def from_events(cls, events):
+        version, type_id, start, count, children = (array("B"), array("B"), array("q"), array("q"), array("q"))
+        values = []
+        # The headers of the open operators, and the indices of their sub-packets so far:
+        headers = []
+        packets = [[]]
+
+        for event in events:
+            if event is None:
+                v, t = headers.pop()
+                sub = packets.pop()
+                n = 0
+            elif event[1] == Type.CONST:
+                v, t, n = event
+                sub = ()
+            else:
+                headers.append(event[:2])
+                packets.append([])
+                continue
+
+            packets[-1].append(len(version))
+            version.append(v)
+            type_id.append(t)
+            values.append(n)
+            start.append(len(children))
+            count.append(len(sub))
+            children.extend(sub)
+
+        fits = not values or max(values) < 2**63
+        return cls(
+            np.frombuffer(version, dtype=np.uint8),
+            np.frombuffer(type_id, dtype=np.uint8),
+            np.array(values, dtype=np.int64 if fits else object),
+            np.frombuffer(start, dtype=np.int64),
+            np.frombuffer(count, dtype=np.int64),
+            np.frombuffer(children, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_hex(cls, hex_stream):
+        return cls.from_events(iter_events(BitReader.from_hex(hex_stream)))
+
+    @classmethod
+    def from_file(cls, file, chunk_size=1 << 16):
+        return cls.from_events(iter_events(BitReader.from_file(file, chunk_size)))
+
+    @classmethod
+    def from_packet(cls, packet):
+        return cls.from_events(packet.events)
+
+    def to_packet(self):
+        types = self.type.tolist()
+        values = self.literal.tolist()
+        versions = self.version.tolist()
+        starts = self.child_start.tolist()
+        counts = self.child_count.tolist()
+        children = self.children.tolist()
+
+        packets = []
+        for i, t in enumerate(types):
+            if t == Type.CONST:
+                packets.append(BITSPacket(versions[i], Type(t), _value=values[i]))
+            else:
+                sub = tuple(packets[c] for c in children[starts[i] : starts[i] + counts[i]])
+                packets.append(BITSPacket(versions[i], Type(t), packets=sub))
+        return packets[-1]
+
+    @property
+    def version_sum(self):
+        return int(self.version.sum(dtype=np.int64))
+
+    @property
+    def type_histogram(self):
+        """Number of packets of every type, indexed by `Type`."""
+        return np.bincount(self.type, minlength=len(Type))
+
+    @property
+    def version_histogram(self):
+        return np.bincount(self.version, minlength=8)
+
+    @cached_property
+    def value(self):
+        types = self.type.tolist()
+        results = self.literal.tolist()
+        starts = self.child_start.tolist()
+        counts = self.child_count.tolist()
+        children = self.children.tolist()
+
+        # Sub-packets come first, so one pass in order does it:
+        for i, t in enumerate(types):
+            if t != Type.CONST:
+                results[i] = OPERATORS[t]([results[c] for c in children[starts[i] : starts[i] + counts[i]]])
+        return results[-1]
@@ -1,27 +1,80 @@
 import enum
 from dataclasses import dataclass
 import operator
-from functools import wraps
-from string import hexdigits
-from itertools import islice
+from functools import wraps, cached_property
 
 from typing import Optional, Tuple
 
 from math import prod
+import random
+
+
+def hex_chunks(file, chunk_size=1 << 16):
+    """Reads a hex transmission from `file` as chunks of bytes."""
+    carry = ""
+    while text := file.read(chunk_size):
+        text = carry + "".join(text.split())
+        cut = len(text) & ~1
+        carry = text[cut:]
+        yield bytes.fromhex(text[:cut])
+    if carry:
+        yield bytes.fromhex(carry + "0")
+
+
+class BitReader:
+    """
+    Reads big-endian bit fields straight out of bytes, a whole field at a
+    time, keeping track of the bit offset. With `chunks`, more bytes are
+    pulled from it as needed, and the ones already read are dropped.
+    """
+
+    def __init__(self, data=b"", pos=0, chunks=None):
+        self.data = data
+        # Bit offset of data[0] in the whole transmission:
+        self.offset = 0
+        self.pos = pos
+        self.chunks = chunks
 
+    @classmethod
+    def from_hex(cls, hex_stream):
+        hex_stream = "".join(hex_stream.split())
+        if len(hex_stream) % 2:
+            hex_stream += "0"
+        return cls(bytes.fromhex(hex_stream))
 
-def to_bitstream(hex_stream):
-    for char in hex_stream:
-        for bit in f"{int(char, 16):04b}":
-            yield int(bit)
-
-
-def take_int(n_bits, bitstream):
-    try:
-        bits = (next(bitstream) for _ in range(n_bits))
-        return int("".join(str(b) for b in bits), 2)
-    except RuntimeError as e:
-        raise ValueError("Not enough bits to take.") from e
+    @classmethod
+    def from_file(cls, file, chunk_size=1 << 16):
+        return cls(chunks=hex_chunks(file, chunk_size))
+
+    def _fill(self, end):
+        # pos may have jumped past the data we have, in which case the bytes in
+        # between are still to come from `chunks`.
+        drop = min((self.pos - self.offset) >> 3, len(self.data))
+        self.offset += drop * 8
+        data = [self.data[drop:]]
+        have = self.offset + len(data[0]) * 8
+
+        for chunk in self.chunks or ():
+            data.append(chunk)
+            have += len(chunk) * 8
+            if have >= end:
+                break
+
+        self.data = b"".join(data)
+        if have < end:
+            raise ValueError("Not enough bits to take.")
+
+    def take(self, n_bits):
+        end = self.pos + n_bits
+        if end > self.offset + len(self.data) * 8:
+            self._fill(end)
+
+        start = self.pos - self.offset
+        stop = end - self.offset
+        chunk = int.from_bytes(self.data[start >> 3 : (stop + 7) >> 3], "big")
+        self.pos = end
+        # Drop the bits after the field in its last byte:
+        return (chunk >> (-stop & 7)) & ((1 << n_bits) - 1)
 
 
 class Type(enum.IntEnum):
@@ -35,6 +88,197 @@ class Type(enum.IntEnum):
     EQ = 7
 
 
+OPERATORS = {
+    Type.SUM: sum,
+    Type.PROD: prod,
+    Type.MIN: min,
+    Type.MAX: max,
+    Type.GT: lambda xs: int(xs[0] > xs[1]),
+    Type.LT: lambda xs: int(xs[0] < xs[1]),
+    Type.EQ: lambda xs: int(xs[0] == xs[1]),
+}
+
+
+def literal_bits(n):
+    """A literal's groups of 4 bits, each with its keep going bit."""
+    n_groups = max(1, (n.bit_length() + 3) // 4)
+    return "".join(f"{int(i > 0)}{(n >> 4 * i) & 0xF:04b}" for i in reversed(range(n_groups)))
+
+
+def take_literal(bitstream):
+    n = 0
+    keep_going = True
+    while keep_going:
+        keep_going = bitstream.take(1)
+        n = (n << 4) | bitstream.take(4)
+    return n
+
+
+def skip(bitstream):
+    """
+    Moves past one packet, jumping over the sub-packets of length-type-0
+    operators without decoding them. The sub-packets of length-type-1
+    operators still have to be skipped one by one.
+    """
+    # Sub-packets left of every open length-type-1 operator:
+    stack = []
+    while True:
+        bitstream.take(3)
+        if bitstream.take(3) == Type.CONST:
+            while bitstream.take(5) & 0x10:
+                pass
+        elif bitstream.take(1) == 0:
+            n_bits = bitstream.take(15)
+            bitstream.pos += n_bits
+        else:
+            n_packets = bitstream.take(11)
+            if n_packets:
+                stack.append(n_packets)
+                continue
+
+        # One more packet done, which may finish its operator, and so on:
+        while stack:
+            stack[-1] -= 1
+            if stack[-1]:
+                break
+            stack.pop()
+        else:
+            return
+
+
+def iter_events(bitstream):
+    """
+    Decodes one packet without recursing, as a stream of events in the
+    order the packets appear: `(version, Type.CONST, value)` for a literal,
+    `(version, type, None)` when an operator starts and `None` after its
+    last sub-packet.
+    """
+    # One [end bit, packets left] per open operator, one of them is None.
+    stack = []
+
+    def child_done():
+        if stack[-1][1] is not None:
+            stack[-1][1] -= 1
+
+    while True:
+        version = bitstream.take(3)
+        type_id = Type(bitstream.take(3))
+
+        if type_id == Type.CONST:
+            yield version, type_id, take_literal(bitstream)
+
+            if not stack:
+                return
+            child_done()
+        else:
+            if bitstream.take(1) == 0:
+                # Number of bits
+                n_bits = bitstream.take(15)
+                stack.append([bitstream.pos + n_bits, None])
+            else:
+                # Number of packets
+                stack.append([None, bitstream.take(11)])
+            yield version, type_id, None
+
+        # Close every group that is complete now, innermost first:
+        while True:
+            end, left = stack[-1]
+            if end is not None:
+                if bitstream.pos < end:
+                    break
+                if bitstream.pos > end:
+                    raise ValueError("Sub-packets overran their length.")
+            elif left:
+                break
+
+            stack.pop()
+            yield None
+            if not stack:
+                return
+            child_done()
+
+
+# Adds one more sub-packet value to an operator's accumulated value:
+ACCUMULATORS = {
+    Type.SUM: operator.add,
+    Type.PROD: operator.mul,
+    Type.MIN: min,
+    Type.MAX: max,
+    Type.GT: lambda a, b: int(a > b),
+    Type.LT: lambda a, b: int(a < b),
+    Type.EQ: lambda a, b: int(a == b),
+}
+EMPTY = {Type.SUM: 0, Type.PROD: 1}
+
+
+def evaluate(bitstream):
+    """
+    Decodes and evaluates one packet in a single pass, without building it.
+    Returns `(value, version_sum)`. Only the accumulated value of every open
+    operator is kept.
+    """
+    version_sum = 0
+    # [type, value so far, number of sub-packets so far] per open operator:
+    stack = []
+    for event in iter_events(bitstream):
+        if event is None:
+            type_id, value, n = stack.pop()
+            if n == 0:
+                if type_id not in EMPTY:
+                    raise ValueError(f"{type_id.name} of no packets.")
+                value = EMPTY[type_id]
+        else:
+            version, type_id, value = event
+            version_sum += version
+            if type_id != Type.CONST:
+                stack.append([type_id, None, 0])
+                continue
+
+        if not stack:
+            return value, version_sum
+
+        frame = stack[-1]
+        frame[1] = value if frame[2] == 0 else ACCUMULATORS[frame[0]](frame[1], value)
+        frame[2] += 1
+
+
+def fold(root, name, combine):
+    """
+    Computes `combine(packet, child_results)` for every packet under `root`,
+    children first, without recursing. Results are memoized as the
+    attribute `name` of each packet (a cached_property), so shared or
+    already evaluated subtrees are not visited again.
+    """
+    stack = [root]
+    while stack:
+        packet = stack[-1]
+        if name in packet.__dict__:
+            stack.pop()
+            continue
+
+        children = packet.packets or ()
+        todo = [p for p in children if name not in p.__dict__]
+        if todo:
+            stack.extend(todo)
+            continue
+
+        # Frozen dataclass: go around __setattr__, like cached_property does.
+        packet.__dict__[name] = combine(packet, [p.__dict__[name] for p in children])
+        stack.pop()
+
+    return root.__dict__[name]
+
+
+def _evaluate(packet, values):
+    if packet.type == Type.CONST:
+        return packet._value
+    return OPERATORS[packet.type](values)
+
+
+def _version_sum(packet, sums):
+    return packet.version + sum(sums)
+
+
 @dataclass(frozen=True)
 class BITSPacket:
     version: int
@@ -42,23 +286,82 @@ class BITSPacket:
     _value: Optional[int] = None
     packets: Optional[Tuple["BITSPacket"]] = None
 
-    @property
+    @cached_property
     def value(self):
-        if self._value is not None:
-            return self._value
-        print(self.code)
-        return eval(self.code)
+        return fold(self, "value", _evaluate)
 
-    @property
+    @cached_property
     def version_sum(self):
-        return sum(p.version for p in self.descendants)
+        return fold(self, "version_sum", _version_sum)
 
     @property
     def descendants(self):
-        yield self
-        if self.packets is not None:
-            for packet in self.packets:
-                yield from packet.descendants
+        stack = [self]
+        while stack:
+            packet = stack.pop()
+            yield packet
+            if packet.packets is not None:
+                stack.extend(reversed(packet.packets))
+
+    @property
+    def events(self):
+        """The events `iter_events` decodes this packet as."""
+        stack = [self]
+        while stack:
+            packet = stack.pop()
+            if packet is None:
+                yield None
+            elif packet.type == Type.CONST:
+                yield packet.version, packet.type, packet._value
+            else:
+                yield packet.version, packet.type, None
+                stack.append(None)
+                stack.extend(reversed(packet.packets))
+
+    def to_hex(self, length_type=None):
+        """
+        Encodes the packet. `length_type` is how operators give the length of
+        their sub-packets: 0 in bits, 1 in packets, or a function choosing
+        one of those for every operator. None (the default) is 0. Where
+        the chosen length doesn't fit its field, the other one is used.
+        """
+        choose = length_type if callable(length_type) else lambda packet: length_type or 0
+
+        # Sizes in bits, sub-packets first. A shared packet gets its header
+        # chosen once, and is encoded the same everywhere it occurs.
+        order = list(self.descendants)
+        size = {}
+        headers = {}
+        for packet in reversed(order):
+            if id(packet) in size:
+                continue
+            if packet.type == Type.CONST:
+                size[id(packet)] = 6 + len(literal_bits(packet._value))
+                continue
+
+            body = sum(size[id(p)] for p in packet.packets)
+            lengths = [(body, 15), (len(packet.packets), 11)]
+            kind = choose(packet)
+            if lengths[kind][0] >= 2 ** lengths[kind][1]:
+                kind = 1 - kind
+            n, width = lengths[kind]
+            if n >= 2 ** width:
+                raise ValueError("Sub-packets too long to encode.")
+
+            headers[id(packet)] = f"{kind}{n:0{width}b}"
+            size[id(packet)] = 6 + len(headers[id(packet)]) + body
+
+        fields = []
+        for packet in order:
+            fields.append(f"{packet.version:03b}{packet.type:03b}")
+            if packet.type == Type.CONST:
+                fields.append(literal_bits(packet._value))
+            else:
+                fields.append(headers[id(packet)])
+
+        bits = "".join(fields)
+        bits += "0" * (-len(bits) % 8)
+        return f"{int(bits, 2):0{len(bits) // 4}X}"
 
     @property
     def needs_parentheses(self):
@@ -66,6 +369,7 @@ class BITSPacket:
 
     @property
     def code(self):
+        """The packet as a Python expression, for debugging."""
         def op(op, nargs=None):
             if self.type == Type.CONST:
                 return str(self.value)
@@ -104,54 +408,217 @@ class BITSPacket:
                 return op("==", 2)
 
     @classmethod
-    def from_hex(cls, hex_stream):
-        return cls.from_bitstream(to_bitstream(hex_stream))
+    def from_hex(cls, hex_stream, interner=None):
+        return cls.from_bitstream(BitReader.from_hex(hex_stream), interner)
 
     @classmethod
-    def from_bitstream(cls, bitstream):
-        def bits(n):
-            return take_int(n, bitstream)
+    def from_file(cls, file, chunk_size=1 << 16, interner=None):
+        return cls.from_bitstream(BitReader.from_file(file, chunk_size), interner)
 
-        version = bits(3)
-        type_id = Type(bits(3))
+    @classmethod
+    def from_bitstream(cls, bitstream, interner=None):
+        return cls.from_events(iter_events(bitstream), interner)
 
-        if type_id == Type.CONST:
-            # Literal
-            xs = []
-            keep_going = True
-            while keep_going:
-                keep_going = bits(1)
-                xs.append(bits(4))
-            n = int("".join(hexdigits[i] for i in xs), 16)
-            return cls(version, type_id, _value=n)
+    @classmethod
+    def from_events(cls, events, interner=None):
+        """Builds the tree, with every packet made by `interner` if given."""
+        make = cls if interner is None else interner
+        # The headers of the open operators, and the sub-packets so far of each:
+        headers = []
+        packets = [[]]
+        for event in events:
+            if event is None:
+                version, type_id = headers.pop()
+                children = tuple(packets.pop())
+                packets[-1].append(make(version, type_id, None, children))
+            elif event[1] == Type.CONST:
+                version, type_id, n = event
+                packets[-1].append(make(version, type_id, n))
+            else:
+                headers.append(event[:2])
+                packets.append([])
+
+        (packet,) = packets[0]
+        return packet
+
+
+class Interner:
+    """
+    Makes packets like BITSPacket does, but hands out the same instance for
+    structurally equal packets. Repeated sub-expressions are then stored
+    once, and their value and version sum computed once.
+    """
+
+    def __init__(self, cls=BITSPacket):
+        self.cls = cls
+        # By (version, type, value, ids of the sub-packets), which are interned already:
+        self.packets = {}
+        self.made = 0
+
+    def __call__(self, version, type_id, _value=None, packets=None):
+        self.made += 1
+        key = (version, type_id, _value, packets and tuple(map(id, packets)))
+        packet = self.packets.get(key)
+        if packet is None:
+            packet = self.packets[key] = self.cls(version, type_id, _value, packets)
+        return packet
+
+    def __len__(self):
+        return len(self.packets)
+
+    @property
+    def dedup_ratio(self):
+        """Packets decoded per unique packet."""
+        return self.made / len(self) if self.packets else 1.0
+
+
+def random_packet(rng=random, packets=50, max_depth=12, max_fanout=8, max_literal_bits=16):
+    """
+    A random well-formed packet tree of about `packets` packets, nested at
+    most `max_depth` operators deep, with up to `max_fanout` sub-packets per
+    operator and literals of up to `max_literal_bits` bits. Pass a seeded
+    random.Random as `rng` for the same tree every time.
+    """
+    comparisons = (Type.GT, Type.LT, Type.EQ)
+    operators = [t for t in Type if t != Type.CONST]
+
+    # Open operators, as [version, type, number of sub-packets, their budget, sub-packets so far]:
+    stack = []
+    budget = packets
+    while True:
+        version = rng.randrange(8)
+        if budget <= 1 or len(stack) >= max_depth:
+            value = rng.getrandbits(rng.randint(1, max_literal_bits))
+            packet = BITSPacket(version, Type.CONST, _value=value)
         else:
-            length_type_id = bits(1)
-            if length_type_id == 0:
-                # Number of bits
-                n_bits = bits(15)
-                packets = []
-                sliced_stream = islice(bitstream, n_bits)
-                try:
-                    while True:
-                        packet = cls.from_bitstream(sliced_stream)
-                        packets.append(packet)
-                except ValueError:
-                    pass
-
-            elif length_type_id == 1:
-                # Number of packets
-                n_packets = bits(11)
-                packets = [cls.from_bitstream(bitstream) for _ in range(n_packets)]
+            type_id = rng.choice(operators)
+            n = 2 if type_id in comparisons else rng.randint(1, min(max_fanout, budget - 1))
+            budget = (budget - 1) // n
+            stack.append([version, type_id, n, budget, []])
+            continue
+
+        # Hand the finished packet to its operator, finishing that too if it was the last:
+        while stack:
+            version, type_id, n, budget, sub = stack[-1]
+            sub.append(packet)
+            if len(sub) < n:
+                break
+            stack.pop()
+            packet = BITSPacket(version, type_id, packets=tuple(sub))
+        else:
+            return packet
+
+
+class PacketView:
+    """
+    A packet decoded on demand from the bytes of a transmission: only its
+    header is read up front. Iterating gives views of the sub-packets, found
+    by skipping over the ones before them, and `view[1, 2]` is the 3rd
+    sub-packet of the 2nd sub-packet.
+    """
+
+    def __init__(self, data, pos=0):
+        self.data = data
+        self.pos = pos
+
+        reader = BitReader(data, pos)
+        self.version = reader.take(3)
+        self.type = Type(reader.take(3))
+        self.length_type = None
+        if self.type == Type.CONST:
+            self.literal = take_literal(reader)
+            self._end = reader.pos
+        else:
+            self.length_type = reader.take(1)
+            # In bits or in packets:
+            self.length = reader.take(15 if self.length_type == 0 else 11)
+            self._start = reader.pos
+            self._end = reader.pos + self.length if self.length_type == 0 else None
 
-            else:
-                assert False  # How would this even happen?
+    @classmethod
+    def from_hex(cls, hex_stream):
+        return cls(BitReader.from_hex(hex_stream).data)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(version={self.version}, type={self.type.name}, pos={self.pos})"
+
+    @property
+    def end(self):
+        """Bit offset just past this packet."""
+        if self._end is None:
+            reader = BitReader(self.data, self.pos)
+            skip(reader)
+            self._end = reader.pos
+        return self._end
+
+    def __iter__(self):
+        if self.type == Type.CONST:
+            return
+
+        pos = self._start
+        if self.length_type == 0:
+            while pos < self._end:
+                packet = PacketView(self.data, pos)
+                yield packet
+                pos = packet.end
+        else:
+            for _ in range(self.length):
+                packet = PacketView(self.data, pos)
+                yield packet
+                pos = packet.end
+
+    def __len__(self):
+        if self.type == Type.CONST:
+            return 0
+        if self.length_type == 1:
+            return self.length
+        return sum(1 for _ in self)
+
+    def __getitem__(self, path):
+        if isinstance(path, tuple):
+            packet = self
+            for index in path:
+                packet = packet[index]
+            return packet
+
+        if path < 0:
+            path += len(self)
+        for i, packet in enumerate(self):
+            if i == path:
+                return packet
+        raise IndexError("No such sub-packet.")
+
+    @cached_property
+    def _evaluated(self):
+        return evaluate(BitReader(self.data, self.pos))
+
+    @property
+    def value(self):
+        return self._evaluated[0]
+
+    @property
+    def version_sum(self):
+        return self._evaluated[1]
 
-            assert all(packet is not None for packet in packets)
+    def to_packet(self, interner=None):
+        return BITSPacket.from_bitstream(BitReader(self.data, self.pos), interner)
 
-            return cls(version, type_id, packets=tuple(packets))
 
-        # There should've been a return at this point:
-        assert False
+def _decode_line(line):
+    return evaluate(BitReader.from_hex(line))
+
+
+def decode_batch(lines, processes=None, chunksize=16):
+    """
+    Decodes and evaluates one transmission per line in a pool of `processes`
+    workers (one per core by default). Yields `(value, version_sum)` for
+    every non-empty line, in the order of the lines.
+    """
+    from multiprocessing import Pool
+
+    lines = (line for line in lines if line.strip())
+    with Pool(processes) as pool:
+        yield from pool.imap(_decode_line, lines, chunksize)
 
 
 if __name__ == "__main__":
@@ -170,3 +637,14 @@ if __name__ == "__main__":
         packet = BITSPacket.from_hex(example)
         print(example, packet.code, packet.value, sep=" -> ")
         assert packet.value == answer
+
+    # Round trips, also with a sub-packet shared by two operators:
+    rng = random.Random(0)
+    shared = BITSPacket(1, Type.SUM, packets=(BITSPacket(2, Type.CONST, _value=3),) * 2)
+    trees = [
+        BITSPacket(0, Type.SUM, packets=(BITSPacket(3, Type.MAX, packets=(shared,)), BITSPacket(4, Type.MIN, packets=(shared,)))),
+        *(random_packet(rng, 200) for _ in range(20)),
+    ]
+    for tree in trees:
+        for _ in range(50):
+            assert BITSPacket.from_hex(tree.to_hex(lambda packet: rng.randrange(2))) == tree
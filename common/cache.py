@@ -0,0 +1,172 @@
+"""
+Cache of parsed inputs, keyed by a hash of the input bytes and the parser.
+
+    @cached_parser(version=1)
+    def parse(file):
+        ...
+
+Numpy arrays are stored as .npy, everything else with marshal if it can,
+pickle otherwise. Entries live in AOC_CACHE_DIR (default
+~/.cache/aoc2021), and the least recently used ones are evicted once the
+directory grows past AOC_CACHE_SIZE megabytes (default 256). Set
+AOC_CACHE=0 to disable. Bump `version` whenever the parser changes what it
+returns.
+"""
+
+from functools import wraps
+from hashlib import sha256
+from io import StringIO
+from pathlib import Path
+import marshal
+import os
+import pickle
+import sys
+import types
+
+SUFFIXES = (".npy", ".marshal", ".pickle")
+
+
+def enabled():
+    return os.environ.get("AOC_CACHE", "1") != "0"
+
+
+def cache_dir():
+    if "AOC_CACHE_DIR" in os.environ:
+        return Path(os.environ["AOC_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(base) / "aoc2021"
+
+
+def max_bytes():
+    return int(float(os.environ.get("AOC_CACHE_SIZE", 256)) * 1024 * 1024)
+
+
+def _is_array(value):
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value, np.ndarray)
+
+
+MARSHAL_SCALARS = (type(None), bool, int, float, complex, str, bytes)
+MARSHAL_CONTAINERS = (tuple, list, set, frozenset)
+
+
+def _marshallable(value):
+    """
+    marshal also accepts anything with a buffer (like numpy arrays), but
+    loads it back as bytes, so only trust it with plain builtins.
+    """
+    todo = [value]
+    while todo:
+        x = todo.pop()
+        if type(x) in MARSHAL_SCALARS:
+            continue
+        elif type(x) in MARSHAL_CONTAINERS:
+            todo.extend(x)
+        elif type(x) is dict:
+            todo.extend(x.keys())
+            todo.extend(x.values())
+        else:
+            return False
+    return True
+
+
+def load(key):
+    """Returns (True, value) on a hit, (False, None) on a miss."""
+    for suffix in SUFFIXES:
+        path = cache_dir() / (key + suffix)
+        try:
+            if suffix == ".npy":
+                import numpy as np
+
+                value = np.load(path, allow_pickle=False)
+            else:
+                with open(path, "rb") as f:
+                    data = f.read()
+                value = (marshal if suffix == ".marshal" else pickle).loads(data)
+        except FileNotFoundError:
+            continue
+        except Exception:
+            # Corrupt, or written by an incompatible version.
+            path.unlink(missing_ok=True)
+            continue
+
+        # Reads don't reliably touch atime, so the mtime tracks recent use.
+        os.utime(path)
+        return True, value
+
+    return False, None
+
+
+def store(key, value):
+    directory = cache_dir()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+
+        if _is_array(value):
+            import numpy as np
+
+            path = directory / (key + ".npy")
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, value, allow_pickle=False)
+        else:
+            if _marshallable(value):
+                suffix, data = ".marshal", marshal.dumps(value)
+            else:
+                suffix, data = ".pickle", pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+            path = directory / (key + suffix)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                f.write(data)
+
+        os.replace(tmp, path)
+        evict(directory, max_bytes())
+    except OSError:
+        # Read-only or full file system, e.g. inside a nix build: just don't cache.
+        pass
+
+
+def evict(directory, limit):
+    entries = []
+    for path in directory.iterdir():
+        if path.suffix in SUFFIXES:
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def cached_parser(version=1):
+    """Caches the result of `parse(file, *args, **kwargs)` by the contents of `file`."""
+
+    def decorator(parse):
+        @wraps(parse)
+        def wrapper(file, *args, **kwargs):
+            if not enabled():
+                return parse(file, *args, **kwargs)
+
+            text = file.read()
+            h = sha256(text.encode())
+            h.update(repr((parse.__code__.co_filename, parse.__qualname__, version)).encode())
+            h.update(repr((args, sorted(kwargs.items()))).encode())
+            key = h.hexdigest()
+
+            hit, value = load(key)
+            if hit:
+                return value
+
+            value = parse(StringIO(text), *args, **kwargs)
+            if isinstance(value, types.GeneratorType):
+                value = list(value)
+            store(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,131 @@
+"""
+A solver daemon that keeps every day module imported (and their caches
+warm) between queries, listening on a Unix socket.
+
+    python -m common.daemon serve [--root DIR]
+    python -m common.daemon ask DAY INPUT [FLAGS ...]
+
+`ask` takes the same flags as `python dayN.py`, e.g.
+
+    python -m common.daemon ask day14 day14/input --iterations 40
+
+Requests and responses are single JSON lines.
+"""
+
+from argparse import ArgumentParser, REMAINDER
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from time import perf_counter
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+
+from .runner import TASKS, load_day
+
+
+def default_socket():
+    return os.environ.get("AOC_SOCKET", f"/tmp/aoc2021-{os.getuid()}.sock")
+
+
+def answer(root, request):
+    """Runs `dayN.py FLAGS INPUT` in-process, returns what it printed."""
+    day = request["day"]
+    module = load_day(root, day)
+
+    output = StringIO()
+    argv = sys.argv
+    sys.argv = [f"{day}.py", *request.get("flags", []), request["input"]]
+    before = perf_counter()
+    try:
+        with redirect_stdout(output):
+            module.main()
+    except SystemExit as e:
+        # argparse bailing out on bad flags.
+        if e.code:
+            raise ValueError(f"{day} exited with {e.code}") from e
+    finally:
+        sys.argv = argv
+
+    return {"output": output.getvalue(), "took": perf_counter() - before}
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            response = answer(self.server.root, json.loads(line))
+        except Exception as e:
+            response = {"error": f"{type(e).__name__}: {e}"}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class Server(socketserver.UnixStreamServer):
+    # One request at a time: answering swaps out sys.argv and sys.stdout.
+    def __init__(self, path, root):
+        self.root = root
+        super().__init__(path, Handler)
+
+
+def serve(path, root):
+    days = sorted({task.day for task in TASKS}, key=lambda d: int(d[3:]))
+    for day in days:
+        load_day(root, day)
+    print(f"Loaded {len(days)} days, listening on {path}", file=sys.stderr)
+
+    if os.path.exists(path):
+        os.unlink(path)
+    # Clean up the socket when killed, too.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        with Server(path, root) as server:
+            server.serve_forever()
+    finally:
+        os.unlink(path)
+
+
+def ask(path, day, input, flags):
+    request = {"day": day, "flags": flags, "input": str(Path(input).resolve())}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--socket", default=default_socket())
+    commands = opts.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve")
+    serve.add_argument("--root", default=".", type=Path)
+
+    ask = commands.add_parser("ask")
+    ask.add_argument("day")
+    ask.add_argument("input")
+    ask.add_argument("flags", nargs=REMAINDER)
+    return opts.parse_args()
+
+
+def main():
+    opts = getopts()
+    if opts.command == "serve":
+        serve(opts.socket, opts.root.resolve())
+        return 0
+
+    response = ask(opts.socket, opts.day, opts.input, opts.flags)
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        return 1
+
+    print(response["output"], end="")
+    print(f"took {response['took'] * 1000:.2f}ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Character grids (digits, pixels) as contiguous numpy arrays, with padding,
+neighbour stencils and flat-index neighbour tables.
+"""
+
+import numpy as np
+
+OFFSETS4 = [(0, 1), (1, 0), (-1, 0), (0, -1)]
+OFFSETS8 = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0)]
+# The full 3x3 window, row major, including the cell itself:
+OFFSETS9 = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1)]
+
+
+def parse_grid(data, mapping=None, dtype=np.uint8):
+    """
+    Parses lines of equal length into a 2D array in one go. Cells are digits,
+    unless `mapping` maps characters to values.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    data = data.replace(b"\r", b"").strip() + b"\n"
+
+    width = data.index(b"\n")
+    if len(data) % (width + 1):
+        raise ValueError("Not all rows of the grid have the same length")
+
+    cells = np.frombuffer(data, dtype=np.uint8).reshape(-1, width + 1)[:, :width]
+    if mapping is None:
+        values = cells - ord("0")
+    else:
+        table = np.zeros(256, dtype=dtype)
+        for char, value in mapping.items():
+            table[ord(char)] = value
+        values = table[cells]
+
+    return np.ascontiguousarray(values, dtype=dtype)
+
+
+def pad(grid, width=1, value=0):
+    return np.pad(grid, width, constant_values=value)
+
+
+def stencil(grid, offsets=OFFSETS4, fill=0):
+    """
+    Views of `grid` shifted by every offset: `stencil(g)[k][i, j]` is
+    `g[i + di, j + dj]` for the k-th offset, or `fill` outside the grid.
+    """
+    r = max(max(abs(di), abs(dj)) for di, dj in offsets)
+    padded = pad(grid, r, fill)
+    h, w = grid.shape
+    return [padded[r + di : r + di + h, r + dj : r + dj + w] for di, dj in offsets]
+
+
+def neighbours4(grid, fill=0):
+    return stencil(grid, OFFSETS4, fill)
+
+
+def neighbours8(grid, fill=0):
+    return stencil(grid, OFFSETS8, fill)
+
+
+def neighbour_table(shape, offsets=OFFSETS4):
+    """
+    Flat indices of the neighbours of every cell, shape (h * w, len(offsets)).
+    Neighbours outside the grid are -1.
+    """
+    index = np.arange(np.prod(shape)).reshape(shape)
+    views = stencil(index, offsets, fill=-1)
+    return np.stack([v.ravel() for v in views], axis=1)
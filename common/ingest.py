@@ -0,0 +1,82 @@
+"""
+Bulk ingestion of big numeric inputs: files are read (or memory mapped) a
+chunk of whole lines at a time, and parsed into numpy arrays in one go.
+"""
+
+import io
+import mmap
+import os
+
+import numpy as np
+
+# Numbers up to 18 digits fit in an int64:
+POWERS = 10 ** np.arange(19, dtype=np.int64)
+
+
+def _mmap(file):
+    """A read-only mapping of `file`, or None if it isn't a regular file."""
+    try:
+        fd = file.fileno()
+        if not os.fstat(fd).st_size:
+            return None
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, io.UnsupportedOperation, ValueError):
+        return None
+
+
+def iter_chunks(file, chunk_size=1 << 24):
+    """
+    The contents of `file` as bytes, about `chunk_size` at a time. Every
+    chunk ends with a line break (bar the last), so no line is split.
+    Regular files are memory mapped, anything else (pipes, StringIO) read.
+    """
+    mapped = _mmap(file)
+    if mapped is not None:
+        with mapped:
+            start, size = 0, len(mapped)
+            while start < size:
+                stop = min(start + chunk_size, size)
+                if stop < size:
+                    # Back to the last line break, or on to the next one for huge lines:
+                    newline = mapped.rfind(b"\n", start, stop)
+                    if newline < 0:
+                        newline = mapped.find(b"\n", stop)
+                    stop = size if newline < 0 else newline + 1
+                yield mapped[start:stop]
+                start = stop
+        return
+
+    if hasattr(file, "buffer"):
+        read = file.buffer.read
+    else:
+        read = lambda n: file.read(n).encode()
+
+    # The partial line at the end of the previous read:
+    carry = b""
+    while data := read(chunk_size):
+        data = carry + data
+        cut = data.rfind(b"\n") + 1
+        carry = data[cut:]
+        if cut:
+            yield data[:cut]
+    if carry:
+        yield carry
+
+
+def parse_uints(buf):
+    """Every run of ASCII digits in `buf` as a number, in an int64 array."""
+    a = np.frombuffer(buf, dtype=np.uint8)
+    where = np.flatnonzero((a >= ord("0")) & (a <= ord("9")))
+    if not len(where):
+        return np.zeros(0, dtype=np.int64)
+
+    # Where every number starts in `where`, and how many digits it has:
+    starts = np.flatnonzero(np.diff(where, prepend=-2) != 1)
+    lengths = np.diff(starts, append=len(where))
+    if lengths.max() >= len(POWERS):
+        raise ValueError("Number too large for int64")
+
+    # The place value of every digit, counting from the end of its number:
+    place = np.repeat(starts + lengths, lengths) - np.arange(len(where)) - 1
+    digits = (a[where] - ord("0")).astype(np.int64)
+    return np.add.reduceat(digits * POWERS[place], starts)
@@ -0,0 +1,164 @@
+"""
+Runs the tasks of every day in a single process pool, instead of one
+`python dayN.py` per Makefile target.
+
+    python -m common.runner [--jobs N] [--root DIR] [DAY ...]
+"""
+
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from importlib.util import module_from_spec, spec_from_file_location
+from io import StringIO
+from pathlib import Path
+from time import perf_counter
+from typing import Optional
+import os
+import sys
+
+
+@dataclass(frozen=True)
+class Task:
+    day: str
+    name: str
+    function: str
+    kwargs: dict = field(default_factory=dict)
+    input: str = "input"
+    # What the Makefile greps for, if anything:
+    expected: Optional[str] = None
+
+
+TASKS = [
+    Task("day1", "task_1", "run", expected="1462"),
+    Task("day1", "task_2", "run", {"window_size": 3}, expected="1497"),
+    Task("day2", "task_1", "solve", {"withAim": False}),
+    Task("day2", "task_2", "solve", {"withAim": True}),
+    Task("day5", "task_1", "solve", expected="7644"),
+    Task("day5", "task_2", "solve", {"diagonals": True}, expected="18627"),
+    Task("day6", "task_1", "solve", expected="373378"),
+    Task("day6", "task_2", "solve", {"days": 256}, expected="1682576647495"),
+    Task("day7", "task_1", "solve", expected="339321"),
+    Task("day7", "task_2", "solve", {"quadratic": True}, expected="95476244"),
+    Task("day8", "task_1", "part1", expected="288"),
+    Task("day8", "task_2", "part2", expected="940724"),
+    Task("day9", "task_1", "part1"),
+    Task("day9", "task_2", "part2"),
+    Task("day10", "task_1", "part1", expected="344193"),
+    Task("day10", "task_2", "part2", expected="3241238967"),
+    Task("day11", "task_1", "solve"),
+    Task("day11", "task_2", "solve"),
+    Task("day12", "task_1", "solve"),
+    Task("day12", "task_2", "solve"),
+    Task("day13", "task_1", "solve"),
+    Task("day13", "task_2", "solve"),
+    Task("day14", "task_1", "solve", {"n": 10}, expected="2233"),
+    Task("day14", "task_2", "solve", {"n": 40}, expected="2884513602164"),
+    Task("day15", "task_1", "solve", expected="410"),
+    Task("day15", "task_2", "solve", {"factor": 5}, expected="2809"),
+    Task("day16", "task_1", "solve", {"version_sum": True}, expected="991"),
+    Task("day16", "task_2", "solve", expected="1264485568252"),
+    Task("day17", "task_1", "solve", {"find_peak": True}, expected="9730"),
+    Task("day17", "task_2", "solve", expected="4110"),
+    Task("day18", "task_1", "solve"),
+    Task("day18", "task_2", "solve"),
+    Task("day19", "task_1", "solve"),
+    Task("day19", "task_2", "solve"),
+    Task("day20", "task_1", "solve", {"passes": 2}, expected="5489"),
+    Task("day20", "task_2", "solve", {"passes": 50}, expected="19066"),
+    Task("day22", "task_1", "solve", {"boundry": 50}, expected="582644"),
+    Task("day22", "task_2", "solve", expected="1263804707062415"),
+    Task("day23", "task_1", "solve", expected="17212"),
+    Task("day23", "task_2", "solve", input="input2", expected="52358"),
+    Task("day24", "task_1", "solve", expected="92969593497992"),
+    Task("day24", "task_2", "solve", {"smallest": True}, expected="81514171161381"),
+]
+
+
+def load_day(root, day):
+    """Imports `root/day/day.py` as the module `day`, once per process."""
+    if day in sys.modules:
+        return sys.modules[day]
+
+    spec = spec_from_file_location(day, Path(root) / day / f"{day}.py")
+    module = module_from_spec(spec)
+    sys.modules[day] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[day]
+        raise
+    return module
+
+
+def call_task(root, task):
+    """Calls the solve function of a task, returns its answer and its stdout."""
+    module = load_day(root, task.day)
+    function = getattr(module, task.function)
+
+    output = StringIO()
+    with open(Path(root) / task.day / task.input) as file, redirect_stdout(output):
+        answer = function(file, **task.kwargs)
+
+    return answer, output.getvalue()
+
+
+def run_task(root, task):
+    before = perf_counter()
+    answer, output = call_task(root, task)
+    took = perf_counter() - before
+
+    # Like the Makefiles, which grep the whole output for the answer:
+    ok = task.expected is None or task.expected in f"{answer}\n{output}"
+    return answer, ok, took
+
+
+def select(days):
+    if not days:
+        return TASKS
+
+    unknown = set(days) - {task.day for task in TASKS}
+    if unknown:
+        raise ValueError(f"Unknown days: {', '.join(sorted(unknown))}")
+    return [task for task in TASKS if task.day in days]
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("days", nargs="*", metavar="DAY")
+    opts.add_argument("--root", default=".", type=Path)
+    opts.add_argument("--jobs", "-j", default=os.cpu_count(), type=int)
+    return opts.parse_args()
+
+
+def main():
+    opts = getopts()
+    tasks = select(opts.days)
+
+    before = perf_counter()
+    with ProcessPoolExecutor(opts.jobs) as pool:
+        futures = [pool.submit(run_task, opts.root, task) for task in tasks]
+
+        failed = False
+        per_day = {}
+        for task, future in zip(tasks, futures):
+            try:
+                answer, ok, took = future.result()
+            except Exception as e:
+                answer, ok, took = f"{type(e).__name__}: {e}", False, 0.0
+
+            failed |= not ok
+            per_day[task.day] = per_day.get(task.day, 0.0) + took
+            status = "ok" if ok else f"FAIL (expected {task.expected})"
+            print(f"{task.day:>5} {task.name}: {answer} [{status}]")
+
+    print()
+    for day, took in per_day.items():
+        print(f"{day:>5}: {took:.3f}s")
+    print(f"total: {perf_counter() - before:.3f}s wall")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
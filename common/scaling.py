@@ -0,0 +1,158 @@
+"""
+Runs solvers on generated inputs of growing size, and fits how their time
+(and peak memory) grows: `time ~ size ** exponent`. Solvers that scale
+worse than their declared target are flagged.
+
+    python -m common.scaling [DAY ...] [--repeat N] [--tolerance T]
+
+Inputs come from each day's mkInput.py, with a fixed seed.
+"""
+
+from argparse import ArgumentParser
+from dataclasses import dataclass, replace
+from importlib.util import module_from_spec, spec_from_file_location
+from math import log
+from multiprocessing import Pool
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Sequence
+import random
+import resource
+import sys
+
+from .runner import TASKS, call_task, load_day
+from .timer import timer, format_duration
+
+
+@dataclass(frozen=True)
+class Target:
+    task: str
+    # Expected growth of the run time with the input size:
+    exponent: float
+    sizes: Sequence[int] = (1, 2, 4, 8, 16)
+
+
+TARGETS = {
+    "day1": Target("task_2", 1),
+    "day2": Target("task_2", 1),
+    # Lines get longer as the grid grows, so the covered points grow faster:
+    "day5": Target("task_2", 1.5),
+    "day6": Target("task_2", 1),
+    "day7": Target("task_2", 1),
+    "day8": Target("task_2", 1),
+    "day9": Target("task_2", 1),
+    "day10": Target("task_2", 1),
+    "day11": Target("task_1", 1, (1, 4, 16, 64)),
+    # Path enumeration, the number of paths grows exponentially:
+    "day12": Target("task_1", 1, (1, 2, 3, 4, 5, 6)),
+    "day13": Target("task_1", 1),
+    "day14": Target("task_2", 1),
+    "day15": Target("task_2", 1, (1, 2, 4, 8)),
+    "day16": Target("task_2", 1, (1, 4, 16, 64)),
+    "day17": Target("task_2", 1),
+    # Every pair of numbers is added for the largest magnitude:
+    "day18": Target("task_1", 2, (1, 2, 3, 4)),
+    # Every pair of scanners is matched:
+    "day19": Target("task_1", 2, (1, 2, 3)),
+    "day20": Target("task_2", 1),
+    "day22": Target("task_2", 2, (1, 2, 3)),
+    "day24": Target("task_1", 1),
+}
+
+
+def load_generator(root, day):
+    spec = spec_from_file_location(f"{day}_mkInput", Path(root) / day / "mkInput.py")
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate(root, day, size, path, seed=0):
+    generator = load_generator(root, day)
+    random.seed(seed)
+    with open(path, "w") as f:
+        for line in generator.generate(size):
+            print(line, file=f)
+
+
+def measure(root, task, repeat):
+    """
+    Runs in a fresh process, so its peak memory is that of this task. Returns
+    the time and how far memory use peaked above that of the loaded module.
+    """
+    load_day(root, task.day)
+    # In kilobytes on Linux:
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    took = []
+    for _ in range(repeat):
+        with timer(task.name, report=False) as span:
+            call_task(root, task)
+        took.append(span.elapsed)
+
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return min(took), (after - before) * 1024
+
+
+def fit(sizes, values):
+    """Least squares slope in log-log space."""
+    xs = [log(s) for s in sizes]
+    ys = [log(v) for v in values]
+    mx = sum(xs) / len(xs)
+    my = sum(ys) / len(ys)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum((x - mx) ** 2 for x in xs)
+
+
+def scale(root, day, repeat=1):
+    target = TARGETS[day]
+    (task,) = (t for t in TASKS if t.day == day and t.name == target.task)
+
+    times, peaks = [], []
+    with TemporaryDirectory() as tmp:
+        for size in target.sizes:
+            path = Path(tmp) / f"{day}-{size}"
+            generate(root, day, size, path)
+
+            # A new process for every run, otherwise the peak memory carries over.
+            with Pool(1, maxtasksperchild=1) as pool:
+                took, peak = pool.apply(measure, (root, replace(task, input=path, expected=None), repeat))
+
+            print(f"{day:>5} size {size:>3}: {format_duration(took):>10}, peak +{peak / 2**20:.1f}MB", file=sys.stderr)
+            times.append(took)
+            peaks.append(peak)
+
+    # Small inputs may not grow memory at all, measure from a page up.
+    return fit(target.sizes, times), fit(target.sizes, [max(p, 4096) for p in peaks])
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("days", nargs="*", metavar="DAY")
+    opts.add_argument("--root", default=".", type=Path)
+    opts.add_argument("--repeat", "-n", default=1, type=int)
+    opts.add_argument("--tolerance", "-t", default=0.25, type=float)
+    return opts.parse_args()
+
+
+def main():
+    opts = getopts()
+    days = opts.days or list(TARGETS)
+
+    flagged = False
+    for day in days:
+        time_exponent, memory_exponent = scale(opts.root, day, opts.repeat)
+        target = TARGETS[day].exponent
+        worse = time_exponent > target + opts.tolerance
+        flagged |= worse
+
+        print(
+            f"{day:>5}: time ~ size^{time_exponent:.2f} (target {target}), "
+            f"memory ~ size^{memory_exponent:.2f}"
+            + (" SCALES WORSE THAN TARGET" if worse else "")
+        )
+
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Weighted shortest path searches over implicit graphs.
+
+All searches take a start state, `neighbours(state)` yielding `(state,
+cost)` pairs and `is_goal(state)`. States are used as dictionary keys,
+unless `encode` maps them to something hashable (and cheaper to hash).
+A state is only pushed if it improves on the best known cost of its key,
+and stale entries are skipped when popped.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from itertools import count
+import heapq
+
+
+@dataclass
+class Stats:
+    expansions: int = 0
+    pushes: int = 0
+    stale_pops: int = 0
+    pruned: int = 0
+
+
+@dataclass
+class Result:
+    cost: Optional[int]
+    state: Any = None
+    stats: Stats = field(default_factory=Stats)
+
+
+def _identity(state):
+    return state
+
+
+def a_star(start, neighbours, is_goal, heuristic=None, encode=None):
+    """A* on a binary heap, plain Dijkstra without `heuristic`. It must not overestimate."""
+    encode = encode or _identity
+    heuristic = heuristic or (lambda state: 0)
+    stats = Stats()
+
+    best = {encode(start): 0}
+    tiebreak = count()
+    frontier = [(heuristic(start), next(tiebreak), 0, start)]
+
+    while frontier:
+        _, _, cost, state = heapq.heappop(frontier)
+        if cost > best[encode(state)]:
+            stats.stale_pops += 1
+            continue
+
+        if is_goal(state):
+            return Result(cost, state, stats)
+
+        stats.expansions += 1
+        for nxt, step in neighbours(state):
+            new_cost = cost + step
+            key = encode(nxt)
+            if new_cost >= best.get(key, new_cost + 1):
+                stats.pruned += 1
+                continue
+
+            best[key] = new_cost
+            heapq.heappush(frontier, (new_cost + heuristic(nxt), next(tiebreak), new_cost, nxt))
+            stats.pushes += 1
+
+    return Result(None, None, stats)
+
+
+def dijkstra(start, neighbours, is_goal, encode=None):
+    return a_star(start, neighbours, is_goal, None, encode)
+
+
+def bucket_dijkstra(start, neighbours, is_goal, encode=None):
+    """Dijkstra with a bucket queue (Dial's algorithm), for small non-negative integer costs."""
+    encode = encode or _identity
+    stats = Stats()
+
+    best = {encode(start): 0}
+    buckets = [[start]]
+    cost = 0
+
+    while cost < len(buckets):
+        bucket = buckets[cost]
+        # Zero cost steps append to the bucket that is being emptied.
+        while bucket:
+            state = bucket.pop()
+            if cost > best[encode(state)]:
+                stats.stale_pops += 1
+                continue
+
+            if is_goal(state):
+                return Result(cost, state, stats)
+
+            stats.expansions += 1
+            for nxt, step in neighbours(state):
+                new_cost = cost + step
+                key = encode(nxt)
+                if new_cost >= best.get(key, new_cost + 1):
+                    stats.pruned += 1
+                    continue
+
+                best[key] = new_cost
+                while len(buckets) <= new_cost:
+                    buckets.append([])
+                buckets[new_cost].append(nxt)
+                stats.pushes += 1
+
+        buckets[cost] = None
+        cost += 1
+
+    return Result(None, None, stats)
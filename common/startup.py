@@ -0,0 +1,78 @@
+"""
+Measures how long importing each day module takes, using `python -X
+importtime`, and fails if any of them is over budget.
+
+    python -m common.startup [DAY ...] [--budget MS] [--repeat N]
+"""
+
+from argparse import ArgumentParser
+from pathlib import Path
+import os
+import re
+import subprocess
+import sys
+
+# Milliseconds, for the days that can't avoid a heavy import at startup:
+BUDGETS = {
+    # The grid days work on numpy arrays throughout, via common.grid:
+    "day9": 500,
+    "day11": 500,
+    "day15": 500,
+    "day20": 500,
+    # numpy is needed to build ROTATIONS at import time.
+    "day19": 500,
+}
+
+IMPORTTIME = re.compile(r"^import time:\s*(\d+) \|\s*(\d+) \| (\s*)(\S+)$")
+
+
+def import_time(root, day):
+    """Cumulative import time of `day`, in milliseconds."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(root.resolve()), os.environ.get("PYTHONPATH", "")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {day}"],
+        cwd=root / day,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME.match(line)
+        if match is not None and not match[3] and match[4] == day:
+            return int(match[2]) / 1000
+
+    raise ValueError(f"No import time reported for {day}")
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("days", nargs="*", metavar="DAY")
+    opts.add_argument("--root", default=".", type=Path)
+    opts.add_argument("--budget", default=100.0, type=float, metavar="MS")
+    opts.add_argument("--repeat", "-n", default=3, type=int)
+    return opts.parse_args()
+
+
+def main():
+    opts = getopts()
+    days = opts.days or sorted(
+        (p.name for p in opts.root.glob("day*") if (p / f"{p.name}.py").exists()),
+        key=lambda d: int(d[3:]),
+    )
+
+    over = False
+    for day in days:
+        took = min(import_time(opts.root, day) for _ in range(opts.repeat))
+        budget = BUDGETS.get(day, opts.budget)
+        ok = took <= budget
+        over |= not ok
+        print(f"{day:>5}: {took:7.2f}ms / {budget:.0f}ms {'ok' if ok else 'OVER BUDGET'}")
+
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,64 @@
+"""
+Timing spans. Spans opened inside another span nest, and the outermost
+one prints the whole tree with total and self time when it closes:
+
+    with timer("day 22"):
+        with timer("parse_dag"):
+            ...
+        with timer("to_disjoint"):
+            ...
+
+Setting AOC_PROFILE to a comma separated list of `cprofile` and
+`tracemalloc` captures a profile around the outermost spans (or the spans
+named in AOC_PROFILE_SPANS), dumped to AOC_PROFILE_DIR as `<span>.pstats`
+and `<span>.snapshot`.
+"""
+
 from time import perf_counter
-from rich.console import Console
-from contextlib import contextmanager
-import sys
+from contextlib import contextmanager, ExitStack
+from functools import cache
+import os
 
-console = Console()
+_stack = []
+_profiling = False
 
 
-@contextmanager
-def timer(name):
-    before = perf_counter()
-    yield
-    after = perf_counter()
+class Span:
+    # A plain class: dataclasses (and inspect with it) is slow to import, and
+    # every day imports this through `common`.
+    __slots__ = ("name", "elapsed", "children")
+
+    def __init__(self, name, elapsed=None, children=None):
+        self.name = name
+        self.elapsed = elapsed
+        self.children = [] if children is None else children
+
+    def __repr__(self):
+        return f"Span(name={self.name!r}, elapsed={self.elapsed!r}, children={self.children!r})"
+
+    @property
+    def self_time(self):
+        return self.elapsed - sum(c.elapsed for c in self.children)
+
+    def lines(self, depth=0):
+        yield (
+            f"{'  ' * depth}[bold red]{self.name}[/bold red]: "
+            f"took [bold]{format_duration(self.elapsed)}[/bold]"
+            + (f" (self {format_duration(self.self_time)})" if self.children else "")
+        )
+        for child in self.children:
+            yield from child.lines(depth + 1)
+
 
-    took = after - before
+@cache
+def console():
+    # rich is slow to import, only pay for it once something gets printed.
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
+def format_duration(took):
     unit = "s"
     if took < 1:
         took *= 1000
@@ -21,4 +67,88 @@ def timer(name):
         took *= 1000
         unit = "μs"
 
-    print(f"[bold red]{name}[/bold red]: took [bold]{took:.02}{unit}[/bold]", file=sys.stderr)
+    return f"{took:.2f}{unit}"
+
+
+def _profile_modes():
+    return {m.strip() for m in os.environ.get("AOC_PROFILE", "").split(",") if m.strip()}
+
+
+def _should_profile(name):
+    spans = os.environ.get("AOC_PROFILE_SPANS")
+    if spans is None:
+        return not _stack
+    return name in (s.strip() for s in spans.split(","))
+
+
+def _dump_path(name, suffix):
+    from pathlib import Path
+    import re
+
+    directory = Path(os.environ.get("AOC_PROFILE_DIR", "."))
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / (re.sub(r"[^\w.-]+", "_", name) + suffix)
+
+
+@contextmanager
+def _cprofile(name):
+    global _profiling
+    if _profiling:
+        # Only one profiler can be active, the outer span already covers this one.
+        yield
+        return
+
+    import cProfile
+
+    profile = cProfile.Profile()
+    _profiling = True
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        _profiling = False
+        profile.dump_stats(_dump_path(name, ".pstats"))
+
+
+@contextmanager
+def _tracemalloc(name):
+    import tracemalloc
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        tracemalloc.take_snapshot().dump(_dump_path(name, ".snapshot"))
+        if started:
+            tracemalloc.stop()
+
+
+@contextmanager
+def timer(name, report=True):
+    span = Span(name)
+    if _stack:
+        _stack[-1].children.append(span)
+
+    with ExitStack() as profiling:
+        if _should_profile(name):
+            modes = _profile_modes()
+            if "tracemalloc" in modes:
+                profiling.enter_context(_tracemalloc(name))
+            if "cprofile" in modes:
+                profiling.enter_context(_cprofile(name))
+
+        _stack.append(span)
+        before = perf_counter()
+        try:
+            yield span
+        finally:
+            after = perf_counter()
+            _stack.pop()
+
+    span.elapsed = after - before
+    if report and not _stack:
+        for line in span.lines():
+            console().print(line, highlight=False)
@@ -2,15 +2,65 @@
 #!nix-shell --pure -p python310 -i python3
 
 from itertools import pairwise, starmap
-from operator import lt
+from operator import lt, gt
 from collections import deque
+from functools import partial
 
 from sys import stdin
 from argparse import ArgumentParser
 import argparse
 
+from common import lazy_import
+
+# Only needed for --numpy:
+np = lazy_import("numpy")
+ingest = lazy_import("common.ingest")
+
+
+def running_sum(it, size):
+    d = deque()
+    total = 0
+    for i in it:
+        d.append(i)
+        total += i
+        if len(d) > size:
+            total -= d.popleft()
+        if len(d) == size:
+            yield total
+
+
+def sliding_extreme(it, size, better):
+    """
+    Minimum (better=lt) or maximum (better=gt) of every window. The deque
+    holds the (index, value) of the values that can still be the best,
+    getting worse towards the back, so the best one is at the front.
+    """
+    d = deque()
+    for n, i in enumerate(it):
+        while d and not better(d[-1][1], i):
+            d.pop()
+        d.append((n, i))
+        if d[0][0] <= n - size:
+            d.popleft()
+        if n >= size - 1:
+            yield d[0][1]
+
+
+# O(1) per sample for these, whatever the window size:
+WINDOWS = {
+    sum: running_sum,
+    min: partial(sliding_extreme, better=lt),
+    max: partial(sliding_extreme, better=gt),
+}
+
+OPS = {"sum": sum, "min": min, "max": max}
+
 
 def window(it, size=3, op=sum):
+    if op in WINDOWS:
+        yield from WINDOWS[op](it, size)
+        return
+
     d = deque(maxlen=size)
     for i in it:
         d.append(i)
@@ -26,24 +76,85 @@ def parse(file):
     return (int(x.strip()) for x in file if x.strip())
 
 
+def run_numpy(file, window_size=None, chunk_size=1 << 24):
+    """Like `run` with sums, but with array operations, a chunk at a time."""
+    size = window_size or 1
+    increases = 0
+    # The last window of the previous chunk:
+    tail = np.zeros(0, dtype=np.int64)
+    for chunk in ingest.iter_chunks(file, chunk_size):
+        xs = np.concatenate([tail, ingest.parse_uints(chunk)])
+        totals = np.concatenate([[0], np.cumsum(xs)])
+        sums = totals[size:] - totals[:-size]
+        increases += np.count_nonzero(sums[1:] > sums[:-1])
+        tail = xs[-size:]
+    return increases
+
+
+def run_windows(file, sizes, chunk_size=1 << 24):
+    """
+    The increases for every window size in `sizes`, in one pass over the
+    file: the sum of a[i+1 : i+w+1] beats that of a[i : i+w] exactly when
+    a[i+w] beats a[i].
+    """
+    counts = dict.fromkeys(sizes, 0)
+    keep = max(counts)
+    # The values the next chunk is compared against:
+    tail = np.zeros(0, dtype=np.int64)
+    for chunk in ingest.iter_chunks(file, chunk_size):
+        xs = np.concatenate([tail, ingest.parse_uints(chunk)])
+        for size in counts:
+            # Pairs ending in the tail were counted with the previous chunk:
+            first = max(len(tail), size)
+            if first < len(xs):
+                counts[size] += int(np.count_nonzero(xs[first:] > xs[first - size : len(xs) - size]))
+        tail = xs[-keep:]
+    return counts
+
+
+def window_sizes(s):
+    sizes = [int(x) for x in s.split(",")]
+    if min(sizes) < 1:
+        raise argparse.ArgumentTypeError("window sizes must be at least 1")
+    return sizes
+
+
 def getopts():
     parser = ArgumentParser()
     parser.add_argument("-w", "--window", type=int, dest="window")
+    parser.add_argument("--op", choices=OPS, default="sum", help="How to combine each window")
+    parser.add_argument("--numpy", action="store_true", help="Parse and count with numpy, in chunks")
+    parser.add_argument("--chunk-size", type=int, default=1 << 24, help="Bytes per chunk for --numpy")
+    parser.add_argument(
+        "--windows", type=window_sizes, help="Comma separated window sizes, all counted in one pass"
+    )
     parser.add_argument(
         "files", metavar="FILE", type=argparse.FileType("r"), default=[stdin], nargs="*"
     )
-    return parser.parse_args()
+    opts = parser.parse_args()
+    if opts.numpy and opts.op != "sum":
+        parser.error("--numpy only supports --op sum")
+    return opts
 
 
-def main(options):
-    for filename in options.files:
-        it = parse(filename)
-        if options.window is not None:
-            it = window(it, options.window)
-        sol = solve(it)
-        print(sol)
+def run(file, window_size=None, op=sum):
+    it = parse(file)
+    if window_size is not None:
+        it = window(it, window_size, op)
+    return solve(it)
 
 
-if __name__ == "__main__":
+def main():
     opts = getopts()
-    main(opts)
+    for filename in opts.files:
+        if opts.windows:
+            for size, count in run_windows(filename, opts.windows, opts.chunk_size).items():
+                print(f"{size}: {count}")
+        elif opts.numpy:
+            print(run_numpy(filename, opts.window, opts.chunk_size))
+        else:
+            print(run(filename, opts.window, OPS[opts.op]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def generate(size):
+    """Sonar depths: a random walk that mostly goes down, 2000 per size."""
+    depth = random.randint(100, 200)
+    for _ in range(2000 * size):
+        yield depth
+        depth = max(0, depth + random.randint(-10, 20))
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
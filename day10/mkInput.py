@@ -0,0 +1,65 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+PARENS = {
+    "(": ")",
+    "[": "]",
+    "{": "}",
+    "<": ">",
+}
+
+
+def line():
+    """Either corrupted, or incomplete with some chunks left open."""
+    corrupt = random.random() < 0.5
+    length = random.randint(80, 110)
+
+    chars = []
+    stack = []
+    while len(chars) < length or not stack:
+        if stack and random.random() < 0.45:
+            closing = stack.pop()
+            if corrupt and random.random() < 0.02:
+                closing = random.choice([c for c in PARENS.values() if c != closing])
+                corrupt = False
+            chars.append(closing)
+        else:
+            opening = random.choice(list(PARENS))
+            stack.append(PARENS[opening])
+            chars.append(opening)
+
+    if corrupt:
+        # Didn't get around to it, break the last chunk instead.
+        chars.append(random.choice([c for c in PARENS.values() if c != stack[-1]]))
+
+    return "".join(chars)
+
+
+def generate(size):
+    """Navigation subsystem lines, 100 per size."""
+    for _ in range(100 * size):
+        yield line()
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
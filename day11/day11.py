@@ -1,44 +1,28 @@
 from argparse import ArgumentParser, FileType
 from sys import stdin
 
-from itertools import product, count
+from itertools import count
 
+from common.grid import parse_grid, neighbours8
 
-def parse(file):
-    grid = {}
-    for i, line in enumerate(file):
-        line = line.strip()
-        if not line:
-            continue
 
-        for j, c in enumerate(line):
-            grid[(i, j)] = int(c)
-    return grid
+def parse(file):
+    return parse_grid(file.read(), dtype=int)
 
 
 def step(grid):
-    grid = {k: (v + 1) for k, v in grid.items()}
-
-    flashers = set()
-    has_flashed = True
-
-    while has_flashed:
-        has_flashed = False
-        # print(flashers)
-        for (x, y), v in grid.items():
-            if v > 9 and (x, y) not in flashers:
-                has_flashed = True
-                flashers.add((x, y))
+    grid = grid + 1
 
-                for dx, dy in product([-1, 0, 1], repeat=2):
-                    if (dx, dy) == (0, 0) or (x + dx, y + dy) not in grid:
-                        continue
-                    grid[x + dx, y + dy] += 1
+    flashing = grid > 9
+    flashers = flashing.copy()
+    while flashing.any():
+        grid += sum(neighbours8(flashing.astype(int)))
+        flashing = (grid > 9) & ~flashers
+        flashers |= flashing
 
-    for flasher in flashers:
-        grid[flasher] = 0
+    grid[flashers] = 0
 
-    return len(flashers), grid
+    return int(flashers.sum()), grid
 
 
 def solve(file):
@@ -51,7 +35,7 @@ def solve(file):
 
         n, grid = step(grid)
         # score += n
-        if n == 100:
+        if n == grid.size:
             break
 
     return s
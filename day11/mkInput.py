@@ -0,0 +1,42 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+from math import isqrt
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def generate(size):
+    """
+    Octopus energy levels, 10 by 10 at size 1, the area growing with size.
+
+    Fully random grids tend to settle into a cycle where they never all flash
+    at once, which day11 would wait for forever. These start out mostly in
+    step (one level, with 10% random cells), so they do.
+    """
+    side = isqrt(10 ** 2 * size)
+    level = random.randint(0, 9)
+    for _ in range(side):
+        yield "".join(
+            str(random.randint(0, 9) if random.random() < 0.1 else level)
+            for _ in range(side)
+        )
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
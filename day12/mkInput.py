@@ -0,0 +1,58 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+from string import ascii_lowercase
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def names(n, upper=False):
+    seen = set()
+    while len(seen) < n:
+        name = "".join(random.choices(ascii_lowercase, k=2))
+        if name not in ("start", "end"):
+            seen.add(name)
+    return [s.upper() if upper else s for s in sorted(seen)]
+
+
+def generate(size):
+    """
+    A cave graph with 6 + size small caves and 2 + size / 4 big ones. Big caves are never connected to each other, or there would be
+    infinitely many paths.
+    """
+    small = names(6 + size)
+    big = names(2 + size // 4, upper=True)
+
+    edges = set()
+    for cave in small + big:
+        others = small if cave in big else small + big
+        for other in random.sample(others, k=min(len(others), random.randint(1, 2))):
+            if other != cave:
+                edges.add(tuple(sorted([cave, other])))
+
+    for end in ["start", "end"]:
+        for cave in random.sample(small + big, k=2):
+            edges.add((end, cave))
+
+    for a, b in sorted(edges):
+        yield f"{a}-{b}"
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ def getopts():
     opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
     opts.add_argument("--seed", "-s", type=int, default=None)
     opts.add_argument("--folds", "-f", type=int, default=10)
+    opts.add_argument("--random", "-r", action="store_true")
+    opts.add_argument("--size", "-n", type=int, default=1)
     return opts.parse_args()
 
 
@@ -22,6 +24,13 @@ def parse(file):
     return dots
 
 
+def random_dots(size):
+    """A random picture in place of a text one: 40 by 6 dots at size 1, wider with size."""
+    return {
+        (x, y) for x in range(40 * size) for y in range(6) if random.random() < 0.4
+    }
+
+
 def add_fold(dots, axis, value):
     if axis == "x":
         new_dots = set()
@@ -55,24 +64,33 @@ def add_folds(dots, n_folds):
     return dots, actions[::-1]
 
 
+def lines(dots, actions):
+    for dot in sorted(dots):
+        yield f"{dot[0]},{dot[1]}"
+    yield ""
+    for action in actions:
+        yield f"fold along {action[0]}={action[1]}"
+
+
+def generate(size, folds=10):
+    return lines(*add_folds(random_dots(size), folds))
+
+
 def main():
     opts = getopts()
 
     if opts.seed is not None:
         random.seed(opts.seed)
 
-    dots = parse(opts.file)
+    if opts.random:
+        dots = random_dots(opts.size)
+    else:
+        dots = parse(opts.file)
 
     dots, actions = add_folds(dots, opts.folds)
 
-    def out(*args, **kwargs):
-        print(*args, file=opts.output, **kwargs)
-
-    for dot in sorted(dots):
-        out(f"{dot[0]},{dot[1]}")
-    out()
-    for action in actions:
-        out(f"fold along {action[0]}={action[1]}")
+    for line in lines(dots, actions):
+        print(line, file=opts.output)
 
 
 if __name__ == "__main__":
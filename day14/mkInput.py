@@ -0,0 +1,37 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+ELEMENTS = "BCFHKNOPSV"
+
+
+def generate(size):
+    """A polymer template of 20 elements per size, with insertion rules for every pair."""
+    yield "".join(random.choices(ELEMENTS, k=20 * size))
+    yield ""
+    for a in ELEMENTS:
+        for b in ELEMENTS:
+            yield f"{a}{b} -> {random.choice(ELEMENTS)}"
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,71 +1,44 @@
 from argparse import ArgumentParser, FileType
 from sys import stdin
-import heapq
-from pprint import pprint
 
+import numpy as np
 
-def parse(file):
-    grid = []
-    for line in file:
-        line = line.strip()
-        if not line:
-            continue
-
-        grid.append([int(x) for x in line])
-    return grid
+from common import cached_parser
+from common.grid import parse_grid, neighbour_table
+from common.search import bucket_dijkstra
 
 
-def extend(grid, factor):
-    new_grid = []
-    for line in grid:
-        new_grid.append([])
-        for i in range(factor):
-            new_grid[-1].extend([(n + i - 1) % 9 + 1 for n in line])
-
-    template = new_grid.copy()
-    for i in range(1, factor):
-        for line in template:
-            new_grid.append([(n + i - 1) % 9 + 1 for n in line])
-    return new_grid
+@cached_parser(version=2)
+def parse(file):
+    return parse_grid(file.read())
 
 
-def is_index(xs, i, j):
-    return 0 <= i < len(xs) and 0 <= j < len(xs[i])
+def extend(grid, factor):
+    h, w = grid.shape
+    shift = np.add.outer(np.arange(factor), np.arange(factor))
+    tiles = grid[None, None, :, :] + shift[:, :, None, None]
+    tiles = (tiles.astype(int) - 1) % 9 + 1
+    return tiles.transpose(0, 2, 1, 3).reshape(factor * h, factor * w)
 
 
-def neighbor_indexes(xs, p):
-    i, j = p
-    return (
-        (i + dx, j + dy)
-        for (dx, dy) in [(0, 1), (1, 0), (-1, 0), (0, -1)]
-        if is_index(xs, i + dx, j + dy)
-    )
+def search(dest, grid):
+    risk = grid.ravel().tolist()
+    neighbors = neighbour_table(grid.shape).tolist()
 
+    def next_steps(curr):
+        for neighbor in neighbors[curr]:
+            if neighbor >= 0:
+                yield neighbor, risk[neighbor]
 
-def search(dest, grid):
-    frontier = []
-    heapq.heappush(frontier, (0, (0, 0)))
-    visited = set()
-    while frontier:
-        danger, curr = heapq.heappop(frontier)
-        if curr in visited:
-            continue
-        visited.add(curr)
-        if curr == dest:
-            return danger
-
-        for neighbor in neighbor_indexes(grid, curr):
-            if neighbor in visited:
-                continue
-            x, y = neighbor
-            heapq.heappush(frontier, (danger + grid[y][x], neighbor))
-    assert False
+    result = bucket_dijkstra(0, next_steps, lambda curr: curr == dest)
+    assert result.cost is not None
+    return result.cost
 
 
 def solve(file, factor=1):
     grid = parse(file)
     grid = extend(grid, factor)
-    dest = len(grid) - 1, len(grid[0]) - 1
+    dest = grid.size - 1
     return search(dest, grid)
 
 
@@ -0,0 +1,33 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+from math import isqrt
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def generate(size):
+    """Risk levels, 100 by 100 at size 1, the area growing with size."""
+    side = isqrt(100 ** 2 * size)
+    for _ in range(side):
+        yield "".join(str(random.randint(1, 9)) for _ in range(side))
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from argparse import ArgumentParser, FileType
-from sys import stdin
+from sys import stdin, stderr
 
 from string import hexdigits
 from itertools import islice
@@ -7,30 +7,68 @@ import operator
 from functools import wraps
 from math import prod
 from common import timer, BITSPacket
+from common.bitsPacket import BitReader, Interner, PacketView, decode_batch, evaluate
 
 
 def getopts():
     opts = ArgumentParser()
     opts.add_argument("files", nargs="*", default=[stdin], type=FileType("r"))
     opts.add_argument("--version-sum", action="store_true")
+    opts.add_argument("--debug", action="store_true", help="Print the packet tree and its code")
+    opts.add_argument("--batch", action="store_true", help="One transmission per line, decoded in parallel")
+    opts.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes for --batch")
+    opts.add_argument("--intern", action="store_true", help="Share identical sub-packets")
+    opts.add_argument(
+        "--path",
+        type=lambda s: tuple(int(i) for i in s.split(",")),
+        help="Only the sub-packet at these indices, e.g. 1,2 for the 3rd sub-packet of the 2nd",
+    )
 
     return opts.parse_args()
 
 
+def solve(file, version_sum=False):
+    value, versions = evaluate(BitReader.from_file(file))
+    return versions if version_sum else value
+
+
 def main():
     opts = getopts()
     for file in opts.files:
         with timer("day 16"):
-            s = file.read().strip()
-            packet = BITSPacket.from_hex(s)
-            print(packet)
-            xs = {(p.version, p.type) for p in packet.descendants}
-            ys = {(a, b) for a in range(8) for b in range(8) if (a, b) not in xs}
-            print(ys)
+            if opts.batch:
+                for value, version_sum in decode_batch(file, opts.jobs):
+                    print(version_sum if opts.version_sum else value)
+                continue
+
+            if opts.path:
+                packet = PacketView.from_hex(file.read())[opts.path]
+                print(packet.version_sum if opts.version_sum else packet.value)
+                continue
+
+            if not (opts.debug or opts.intern):
+                # No tree needed:
+                value, version_sum = evaluate(BitReader.from_file(file))
+                print(version_sum if opts.version_sum else value)
+                continue
+
+            interner = Interner() if opts.intern else None
+            packet = BITSPacket.from_file(file, interner=interner)
+            if interner is not None:
+                print(
+                    f"{interner.made} packets, {len(interner)} unique ({interner.dedup_ratio:.2f}x)",
+                    file=stderr,
+                )
+            if opts.debug:
+                print(packet)
+                xs = {(p.version, p.type) for p in packet.descendants}
+                ys = {(a, b) for a in range(8) for b in range(8) if (a, b) not in xs}
+                print(ys)
             if opts.version_sum:
                 print(packet.version_sum)
             else:
-                print(packet.code)
+                if opts.debug:
+                    print(packet.code)
                 print(packet.value)
 
 
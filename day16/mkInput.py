@@ -0,0 +1,34 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+import random
+
+from common.bitsPacket import random_packet
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    opts.add_argument("--max-depth", "-d", type=int, default=12)
+    return opts.parse_args()
+
+
+def generate(size, max_depth=12):
+    """A BITS transmission of about 50 packets per size."""
+    packet = random_packet(random, 50 * size, max_depth)
+    yield packet.to_hex(lambda packet: random.randrange(2))
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size, opts.max_depth):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
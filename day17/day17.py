@@ -141,6 +141,13 @@ def count_trajectories(x1, x2, y1, y2):
     return n
 
 
+def solve(file, find_peak=False):
+    x1, x2, y1, y2 = xs = parse(file)
+    if find_peak:
+        return max_y(y1, y2)
+    return count_trajectories(*xs)
+
+
 def getopts():
     opts = ArgumentParser()
     opts.add_argument("files", nargs="*", default=[stdin], type=FileType("r"))
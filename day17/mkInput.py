@@ -0,0 +1,36 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+from math import isqrt
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def generate(size):
+    """A target area, its distance and extent growing with the square root of size."""
+    scale = isqrt(size)
+    x1 = random.randint(20, 200) * scale
+    x2 = x1 + random.randint(10, 50) * scale
+    y1 = -random.randint(50, 150) * scale
+    y2 = y1 + random.randint(10, 40) * scale
+    yield f"target area: x={x1}..{x2}, y={y1}..{y2}"
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
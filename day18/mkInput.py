@@ -0,0 +1,38 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def number(depth=0):
+    """A random reduced snailfish number: no pairs nested inside four pairs."""
+    if depth == 4 or (depth > 0 and random.random() < 0.3):
+        return str(random.randint(0, 9))
+    return f"[{number(depth + 1)},{number(depth + 1)}]"
+
+
+def generate(size):
+    """Snailfish homework, 100 numbers per size."""
+    for _ in range(100 * size):
+        yield f"[{number(1)},{number(1)}]"
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ from collections import defaultdict
 from pprint import pprint
 from collections import Counter
 
+from common import timer, cached_parser
+
 try:
     from tqdm import tqdm
 except ImportError:
@@ -15,6 +17,7 @@ except ImportError:
         return arg
 
 
+@cached_parser(version=1)
 def parse(file):
     scanners = []
     for line in file:
@@ -155,15 +158,20 @@ def distance(p1, p2, d=2):
 
 
 def solve(file):
-    xs = parse(file)
-    network = search(xs)
-    assembled = assemble(xs, network)
+    with timer("day 19"):
+        with timer("parse"):
+            xs = parse(file)
+        with timer("search"):
+            network = search(xs)
+        with timer("assemble"):
+            assembled = assemble(xs, network)
+        with timer("actual_locs"):
+            scanner_locs = actual_locs(xs, network)
     pprint(network)
     # for p in assembled:
     #     x, y, z = p
     #     print(f"{x},{y},{z}")
     print(len(assembled))
-    scanner_locs = actual_locs(xs, network)
     max_pts = max(
         product(scanner_locs.values(), repeat=2),
         key=lambda x: distance(*x, d=1),
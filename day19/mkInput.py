@@ -0,0 +1,125 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+from itertools import permutations, product
+import random
+
+RANGE = 1000
+# Neighbouring scanners are at most this far apart along any axis:
+SPREAD = 1100
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def parity(perm):
+    inversions = sum(a > b for i, a in enumerate(perm) for b in perm[i + 1 :])
+    return -1 if inversions % 2 else 1
+
+
+ROTATIONS = [
+    (perm, signs)
+    for perm in permutations(range(3))
+    for signs in product((-1, 1), repeat=3)
+    if parity(perm) * signs[0] * signs[1] * signs[2] == 1
+]
+
+
+def rotate(rotation, point):
+    perm, signs = rotation
+    return tuple(s * point[i] for i, s in zip(perm, signs))
+
+
+def cell(point):
+    return tuple(c // (2 * RANGE) for c in point)
+
+
+def near(grid, point, distance):
+    """Points in `grid` within `distance` (at most 2 * RANGE) along every axis."""
+    for c in product(*(range(x - 1, x + 2) for x in cell(point))):
+        for p in grid.get(c, []):
+            if all(abs(a - b) <= distance for a, b in zip(p, point)):
+                yield p
+
+
+def next_scanner(scanner):
+    """Just out of range of `scanner` along some axes, close along the others."""
+    while True:
+        direction = [random.choice((-1, 0, 1)) for _ in range(3)]
+        if any(direction):
+            break
+
+    return tuple(
+        c + (d * random.randint(RANGE, SPREAD) if d else random.randint(-300, 300))
+        for c, d in zip(scanner, direction)
+    )
+
+
+def generate(size):
+    """
+    Scanner reports, 25 scanners per size. The scanners form a branching
+    random walk, with only consecutive ones in range of each other's
+    beacons: each one shares 12 beacons with the one before it, and has 14
+    of its own. Every beacon in range is reported, in the scanner's own
+    orientation.
+    """
+    scanners = [(0, 0, 0)]
+    beacons = set()
+    scanner_grid = {cell(scanners[0]): [scanners[0]]}
+    beacon_grid = {}
+
+    def add_beacons(lo, hi, n, seen_by):
+        """Adds beacons in the box, out of range of any scanner not in `seen_by`."""
+        while n > 0:
+            b = tuple(random.randint(l, h) for l, h in zip(lo, hi))
+            if b in beacons or any(s not in seen_by for s in near(scanner_grid, b, RANGE)):
+                continue
+            beacons.add(b)
+            beacon_grid.setdefault(cell(b), []).append(b)
+            n -= 1
+
+    add_beacons([-RANGE] * 3, [RANGE] * 3, 14, scanners[:1])
+    parent = scanners[0]
+    while len(scanners) < 25 * size:
+        scanner = next_scanner(parent)
+        if any(s != parent for s in near(scanner_grid, scanner, 2 * RANGE)):
+            # Too close to the path so far, maybe branch off somewhere else.
+            if random.random() < 0.1:
+                parent = random.choice(scanners)
+            continue
+
+        scanners.append(scanner)
+        scanner_grid.setdefault(cell(scanner), []).append(scanner)
+
+        lo = [max(a, b) - RANGE for a, b in zip(parent, scanner)]
+        hi = [min(a, b) + RANGE for a, b in zip(parent, scanner)]
+        add_beacons(lo, hi, 12, [parent, scanner])
+        add_beacons([c - RANGE for c in scanner], [c + RANGE for c in scanner], 14, [scanner])
+        parent = scanner
+
+    for i, scanner in enumerate(scanners):
+        if i:
+            yield ""
+        yield f"--- scanner {i} ---"
+
+        rotation = random.choice(ROTATIONS)
+        for b in near(beacon_grid, scanner, RANGE):
+            x, y, z = rotate(rotation, tuple(p - q for p, q in zip(b, scanner)))
+            yield f"{x},{y},{z}"
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,15 @@
 #! nix-shell -p "python3" -i python
 
 from sys import stdin
+from functools import reduce
 import argparse
 
+from common import lazy_import
+
+# Only needed for --numpy:
+np = lazy_import("numpy")
+ingest = lazy_import("common.ingest")
+
 directions = {
     "down": (1, 0),
     "up": (-1, 0),
@@ -23,14 +30,90 @@ def parse(file):
         yield dx * amount, dy * amount
 
 
-def solve(file, withAim=True):
+def summarize(lines):
+    """
+    The (aim, y, x with aim) after some commands, starting from zero. Without
+    aim, x would just be the aim.
+    """
     x = y = aim = 0
-    for dx, dy in parse(file):
+    for dx, dy in parse(lines):
         aim += dx
         y += dy
-        x += dy * aim if withAim else dx
+        x += dy * aim
+
+    return aim, y, x
+
+
+def compose(first, second):
+    """The summary of two runs of commands, one after the other."""
+    aim1, y1, x1 = first
+    aim2, y2, x2 = second
+    # The second run starts with aim1 instead of 0:
+    return aim1 + aim2, y1 + y2, x1 + x2 + aim1 * y2
+
+
+def result(summary, withAim=True):
+    aim, y, x = summary
+    return (x if withAim else aim) * y
+
+
+def solve(file, withAim=True):
+    return result(summarize(file), withAim)
+
+
+def summarize_chunk(chunk):
+    return summarize(chunk.decode().splitlines())
+
+
+def summarize_array(chunk):
+    """summarize for a chunk of whole lines, with array operations."""
+    a = np.frombuffer(chunk, dtype=np.uint8)
+    # The first letter tells the commands apart. Like parse, skip leading
+    # whitespace and blank lines: whitespace is all at or below b" ".
+    letters = np.flatnonzero(a > ord(" "))
+    lines = np.searchsorted(np.flatnonzero(a == ord("\n")), letters)
+    starts = letters[np.diff(lines, prepend=-1) != 0]
+    actions = a[starts]
+
+    # parse rejects anything but these words, so check all of each word, and
+    # that it ends there:
+    padded = np.append(a, ord("\n"))
+    checked = 0
+    for word in directions:
+        at = starts[actions == ord(word[0])]
+        found = padded[np.minimum(at[:, None] + np.arange(len(word) + 1), len(a))]
+        spelled = (found[:, :-1] == np.frombuffer(word.encode(), dtype=np.uint8)).all()
+        if not (spelled and (found[:, -1] <= ord(" ")).all()):
+            raise ValueError(f"Unknown command, expected one of {', '.join(directions)}")
+        checked += len(at)
+    if checked != len(actions):
+        raise ValueError(f"Unknown command, expected one of {', '.join(directions)}")
 
-    return x * y
+    amounts = ingest.parse_uints(chunk)
+    if len(actions) != len(amounts):
+        raise ValueError("Every command needs exactly one amount")
+    dx = np.where(actions == ord("d"), amounts, 0) - np.where(actions == ord("u"), amounts, 0)
+    dy = np.where(actions == ord("f"), amounts, 0)
+
+    aim = np.cumsum(dx)
+    if not len(aim):
+        return 0, 0, 0
+    return int(aim[-1]), int(dy.sum()), int(dy @ aim)
+
+
+def solve_numpy(file, withAim=True, chunk_size=1 << 22):
+    summaries = map(summarize_array, ingest.iter_chunks(file, chunk_size))
+    return result(reduce(compose, summaries, (0, 0, 0)), withAim)
+
+
+def solve_parallel(file, withAim=True, jobs=None, chunk_size=1 << 22, numpy=False):
+    """solve, with chunks of the file summarized in `jobs` processes."""
+    from multiprocessing import Pool
+
+    with Pool(jobs) as pool:
+        worker = summarize_array if numpy else summarize_chunk
+        summaries = pool.imap(worker, ingest.iter_chunks(file, chunk_size))
+        return result(reduce(compose, summaries, (0, 0, 0)), withAim)
 
 
 def getopts():
@@ -41,6 +124,26 @@ def getopts():
         action="store_true",
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Summarize chunks of the file in this many processes",
+    )
+
+    parser.add_argument(
+        "--numpy",
+        action="store_true",
+        help="Parse and sum chunks with array operations",
+    )
+
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1 << 22,
+        help="Bytes per chunk for --jobs and --numpy",
+    )
+
     parser.add_argument(
         "files",
         type=argparse.FileType("r"),
@@ -55,7 +158,12 @@ def getopts():
 def main():
     opts = getopts()
     for file in opts.files:
-        print(solve(file, withAim=opts.withAim))
+        if opts.jobs:
+            print(solve_parallel(file, opts.withAim, opts.jobs, opts.chunk_size, opts.numpy))
+        elif opts.numpy:
+            print(solve_numpy(file, opts.withAim, opts.chunk_size))
+        else:
+            print(solve(file, withAim=opts.withAim))
 
 
 if __name__ == "__main__":
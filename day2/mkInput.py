@@ -0,0 +1,32 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def generate(size):
+    """Submarine commands, 1000 per size."""
+    for _ in range(1000 * size):
+        action = random.choices(["forward", "down", "up"], weights=[3, 2, 1])[0]
+        yield f"{action} {random.randint(1, 9)}"
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,68 +1,46 @@
 from argparse import ArgumentParser, FileType
 from sys import stdin
 
-from itertools import product
+import numpy as np
 
-from functools import cache
+from common import cached_parser
+from common.grid import parse_grid, pad, stencil, OFFSETS9
 
 RANGE = 1
 N_BITS = (2 * RANGE + 1) ** 2
 
+PIXELS = {"#": 1, ".": 0}
 
+
+@cached_parser(version=2)
 def parse(file):
-    repl = [x == "#" for x in next(file).strip()]
+    repl = np.array([x == "#" for x in next(file).strip()])
     assert len(repl) == 2 ** N_BITS
 
-    grid = set()
-    for x, line in enumerate(file):
-        for y, c in enumerate(line):
-            if c == "#":
-                grid.add((x, y))
+    grid = parse_grid(file.read(), mapping=PIXELS, dtype=bool)
 
     return repl, grid
 
 
-@cache
-def neighbors(p):
-    x, y = p
-    return [(x + dx, y + dy) for dx, dy in product([-1, 0, 1], repeat=2)]
-
-
-def bounds(grid):
-    x = lambda p: p[0]
-    y = lambda p: p[1]
+def enhance(repl, grid, background):
+    """One pass, growing the image by a pixel on every side; the infinite background may flip too."""
+    grid = pad(grid, 1, background)
 
-    min_x = min(map(x, grid))
-    max_x = max(map(x, grid))
+    n = np.zeros(grid.shape, dtype=int)
+    for view in stencil(grid, OFFSETS9, background):
+        n = (n << 1) | view
 
-    min_y = min(map(y, grid))
-    max_y = max(map(y, grid))
-
-    return (min_x, min_y), (max_x, max_y)
+    return repl[n], repl[-1 if background else 0]
 
 
 def solve(file, passes=50):
     repl, grid = parse(file)
 
-    @cache
-    def get_point(t, x, y):
-        if t == 0:
-            return (x, y) in grid
-
-        n = sum(
-            1 << c
-            for c, p in enumerate(reversed(neighbors((x, y))))
-            if get_point(t - 1, *p)
-        )
-
-        return repl[n]
-
-    (min_x, min_y), (max_x, max_y) = bounds(grid)
-    return sum(
-        get_point(passes, x, y)
-        for x in range(min_x - passes, max_x + passes + 1)
-        for y in range(min_y - passes, max_y + passes + 1)
-    )
+    background = False
+    for _ in range(passes):
+        grid, background = enhance(repl, grid, background)
+
+    return int(grid.sum())
 
 
 def getopts():
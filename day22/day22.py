@@ -8,7 +8,9 @@ from collections import defaultdict
 from math import prod
 import bisect
 
-import networkx as nx
+from common import timer, cached_parser, lazy_import
+
+nx = lazy_import("networkx")
 
 
 def intersects_1d(l1, l2):
@@ -118,6 +120,7 @@ class Cuboid:
         return prod(b - a + 1 for (a, b) in self.dims)
 
 
+@cached_parser(version=1)
 def parse(file):
     for line in file:
         line = line.strip()
@@ -195,8 +198,11 @@ def solve(file, boundry=None):
     if boundry is not None:
         x = boundry
         boundry = Cuboid((-x, x), (-x, x), (-x, x), None)
-    g = parse_dag(file, boundry=boundry)
-    fills = to_disjoint(g)
+    with timer("day 22"):
+        with timer("parse_dag"):
+            g = parse_dag(file, boundry=boundry)
+        with timer("to_disjoint"):
+            fills = to_disjoint(g)
     pprint(sorted(fills, key=lambda x: x.volume))
 
     res = sum(x.volume for x in fills if x.fill)
@@ -0,0 +1,47 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def cuboid(lo, hi, max_size):
+    dims = []
+    for axis in "xyz":
+        a = random.randint(lo, hi - 1)
+        b = min(hi, a + random.randint(1, max_size))
+        dims.append(f"{axis}={a}..{b}")
+    return ",".join(dims)
+
+
+def generate(size):
+    """
+    Reboot steps, 420 per size. The first 20 are inside the initialization
+    region, like in the puzzle input; the rest are big.
+    """
+    for i in range(420 * size):
+        action = "on" if i == 0 or random.random() < 0.6 else "off"
+        if i < 20:
+            yield f"{action} {cuboid(-50, 50, 40)}"
+        else:
+            yield f"{action} {cuboid(-100_000, 100_000, 40_000)}"
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
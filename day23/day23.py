@@ -2,16 +2,10 @@ from argparse import ArgumentParser, FileType
 from sys import stdin
 
 import itertools
-import heapq
 
 from functools import cache
 
-try:
-    from tqdm import tqdm
-except ImportError:
-
-    def tqdm(arg, **kwargs):
-        return arg
+from common.search import a_star
 
 
 def parse(file):
@@ -229,79 +223,23 @@ def to_string(configuration, spaces):
     return s.strip()
 
 
-def a_star(configuration, spaces):
-    """
-    A* search.
-    """
-    best = heuristic(configuration, spaces)
-    open = [(best, 0, to_hashable(configuration))]
-    closed = set()
-
-    for i in tqdm(itertools.count()):
-        if not open:
-            print("\n\noptions exhausted after {} steps".format(i))
-            return None
-
-        # To get accurate tqdm stats:
-        _, real_cost, configuration = heapq.heappop(open)
-
-        configuration = from_hashable(configuration)
-
-        if heuristic(configuration, spaces) < best:
-            print()
-            print(to_string(configuration, spaces))
-            print(len(open), len(closed), real_cost)
-            best = heuristic(configuration, spaces)
-
-        # if count_finals(configuration) > best_finals:
-        #     print()
-        #     print(to_string(configuration, spaces))
-        #     best_finals = count_finals(configuration)
-
-        # if i % 10000 == 0:
-        #     print(configuration)
-        #     print(len(closed), len(open))
-
-        #     # Cleanup...
-        #     # open = sorted(c for c in open if c[2] not in closed)
-        #     # print(len(closed), len(open))
-
-        if is_final(configuration):
-            # c_plus_h is the cost plus heuristic, so it's the total cost because the heuristic is 0
-            return real_cost
-
-        for config, cost in step(spaces, configuration):
-            if to_hashable(config) not in closed:
-                heapq.heappush(
-                    open,
-                    (
-                        (
-                            real_cost + cost + heuristic(config, spaces),
-                            real_cost + cost,
-                            to_hashable(config),
-                        )
-                    ),
-                )
-
-        closed.add(to_hashable(configuration))
-
-    return None
-
-
 def solve(file):
     spaces, start = parse(file)
     spaces = frozenset(spaces)
-    print(spaces)
 
-    for k in start:
-        print(k, *reachable_squares(k, spaces, start))
+    def neighbors(configuration):
+        for config, cost in step(spaces, from_hashable(configuration)):
+            yield to_hashable(config), cost
 
-    # print(spaces, start)
-    # print(is_final(start))
-    # print(heuristic(start))
-    # print(DISTANCE_PAIRS[(3, 3), (3, 9)])
+    result = a_star(
+        to_hashable(start),
+        neighbors,
+        lambda configuration: is_final(from_hashable(configuration)),
+        lambda configuration: heuristic(from_hashable(configuration), spaces),
+    )
+    print(result.stats)
 
-    return a_star(start, spaces)
+    return result.cost
 
 
 def getopts():
@@ -0,0 +1,42 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def generate(size):
+    """
+    A burrow with amphipods in random rooms. day23 has the burrow geometry
+    built in, so size can only choose between the folded (size 1) and the
+    unfolded (any larger size) diagram.
+    """
+    depth = 2 if size == 1 else 4
+    amphipods = random.sample("ABCD" * depth, 4 * depth)
+
+    yield "#############"
+    yield "#...........#"
+    for row in range(depth):
+        rooms = "#".join(amphipods[4 * row : 4 * row + 4])
+        yield f"###{rooms}###" if row == 0 else f"  #{rooms}#"
+    yield "  #########"
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+BLOCK = """inp w
+mul x 0
+add x z
+mod x 26
+div z {div}
+add x {check}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {offset}
+mul y x
+add z y"""
+
+
+def generate(size):
+    """
+    A MONAD program for a model number of 14 digits per size: each digit
+    pushes onto the base 26 stack in z, or pops and checks against an
+    earlier one.
+    """
+    pairs = 7 * size
+    pushed = []
+    opened = 0
+    for i in range(2 * pairs):
+        if opened < pairs and (not pushed or random.random() < 0.5):
+            offset = random.randint(1, 16)
+            pushed.append(offset)
+            opened += 1
+            yield BLOCK.format(div=1, check=random.randint(10, 16), offset=offset)
+        else:
+            # The difference between the two digits must be a single digit.
+            check = random.randint(-8, 8) - pushed.pop()
+            yield BLOCK.format(div=26, check=check, offset=random.randint(1, 16))
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,12 @@ from sys import stdin
 from itertools import permutations
 from argparse import ArgumentParser, FileType
 
+from common import lazy_import
+
+# Only needed for --canvas:
+np = lazy_import("numpy")
+ingest = lazy_import("common.ingest")
+
 
 def points(begin, end, diagonal=False):
     (x1, y1), (x2, y2) = begin, end
@@ -60,9 +66,81 @@ def solve(file, diagonals=False):
     print(res)
 
 
+def covered(segments):
+    """Every point on the segments, as arrays of x and y."""
+    x1, y1, x2, y2 = segments.T
+    dx, dy = np.sign(x2 - x1), np.sign(y2 - y1)
+    lengths = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)) + 1
+
+    # How far along its segment every point is:
+    steps = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    xs = np.repeat(x1, lengths) + steps * np.repeat(dx, lengths)
+    ys = np.repeat(y1, lengths) + steps * np.repeat(dy, lengths)
+    return xs, ys
+
+
+def grow(canvas, height, width):
+    h, w = canvas.shape
+    if height <= h and width <= w:
+        return canvas
+
+    # With some room to spare, so it doesn't have to be copied every time:
+    grown = np.zeros((max(height, h + h // 4), max(width, w + w // 4)), dtype=canvas.dtype)
+    grown[:h, :w] = canvas
+    return grown
+
+
+def solve_canvas(file, diagonals=False, chunk_size=1 << 24, batch=1 << 22):
+    """
+    solve on a dense canvas of how often every point is covered, saturating
+    at 2. Segments are drawn in batches of about `batch` points.
+    """
+    canvas = np.zeros((0, 0), dtype=np.uint8)
+    for chunk in ingest.iter_chunks(file, chunk_size):
+        segments = ingest.parse_uints(chunk).reshape(-1, 4)
+        x1, y1, x2, y2 = segments.T
+        straight = (x1 == x2) | (y1 == y2)
+        if not diagonals:
+            segments = segments[straight]
+        elif (np.abs(x2 - x1) != np.abs(y2 - y1))[~straight].any():
+            raise ValueError("Lines must be horizontal, vertical or at 45 degrees")
+        if not len(segments):
+            continue
+
+        lengths = np.abs(segments[:, :2] - segments[:, 2:]).max(axis=1) + 1
+        ends = np.cumsum(lengths)
+        start = 0
+        while start < len(segments):
+            done = ends[start - 1] if start else 0
+            stop = max(start + 1, np.searchsorted(ends, done + batch, side="right"))
+            xs, ys = covered(segments[start:stop])
+            start = stop
+
+            canvas = grow(canvas, ys.max() + 1, xs.max() + 1)
+            flat = ys * canvas.shape[1] + xs
+            lo = flat.min()
+            span = flat.max() - lo + 1
+            if span <= 4 * len(flat):
+                counts = np.bincount(flat - lo, minlength=span)
+                cells = np.flatnonzero(counts)
+                counts = counts[cells]
+                cells += lo
+            else:
+                # Too spread out to count densely:
+                cells, counts = np.unique(flat, return_counts=True)
+
+            view = canvas.reshape(-1)
+            view[cells] = np.minimum(view[cells] + np.minimum(counts, 2), 2)
+
+    res = int(np.count_nonzero(canvas >= 2))
+    print(res)
+    return res
+
+
 def getopts():
     opts = ArgumentParser()
     opts.add_argument("--diagonals", "-d", action="store_true")
+    opts.add_argument("--canvas", action="store_true", help="Draw the lines on a numpy array")
     opts.add_argument("files", nargs="*", default=[stdin], type=FileType("r"))
     return opts.parse_args()
 
@@ -70,7 +148,10 @@ def getopts():
 def main():
     opts = getopts()
     for file in opts.files:
-        solve(file, diagonals=opts.diagonals)
+        if opts.canvas:
+            solve_canvas(file, diagonals=opts.diagonals)
+        else:
+            solve(file, diagonals=opts.diagonals)
 
 
 if __name__ == "__main__":
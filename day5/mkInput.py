@@ -0,0 +1,49 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+from math import isqrt
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def generate(size):
+    """
+    Horizontal, vertical and diagonal vent lines, 500 per size, on a grid
+    whose area grows with size (1000 by 1000 at size 1).
+    """
+    side = isqrt(1000 ** 2 * size)
+    for _ in range(500 * size):
+        dx, dy = random.choice([(1, 0), (0, 1), (1, 1), (1, -1)])
+        if random.random() < 0.5:
+            dx, dy = -dx, -dy
+        n = random.randint(1, side // 3)
+
+        x1 = random.randrange(side)
+        y1 = random.randrange(side)
+        # Stay on the grid:
+        if dx:
+            n = min(n, side - 1 - x1 if dx > 0 else x1)
+        if dy:
+            n = min(n, side - 1 - y1 if dy > 0 else y1)
+
+        yield f"{x1},{y1} -> {x1 + n * dx},{y1 + n * dy}"
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+DIGITS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+
+
+def scramble(digit, wiring):
+    wires = [wiring[c] for c in digit]
+    random.shuffle(wires)
+    return "".join(wires)
+
+
+def generate(size):
+    """Displays with randomly crossed wires, 200 per size."""
+    for _ in range(200 * size):
+        wiring = dict(zip("abcdefg", random.sample("abcdefg", 7)))
+        signals = [scramble(d, wiring) for d in random.sample(DIGITS, len(DIGITS))]
+        output = [scramble(random.choice(DIGITS), wiring) for _ in range(4)]
+        yield f"{' '.join(signals)} | {' '.join(output)}"
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,97 +1,53 @@
 from argparse import ArgumentParser, FileType
 from sys import stdin
 
-from itertools import product
-from functools import cache, reduce
+from functools import reduce
 from operator import mul
-from collections import defaultdict
-from pprint import pprint
 
+import numpy as np
 
-def parse(file):
-    xs = []
-    for line in file:
-        line = line.strip()
-        if not line:
-            continue
-        xs.append([int(x) for x in line])
-
-    return xs
-
+from common.grid import parse_grid, stencil
 
-def safe_index(xs, i, j):
-    try:
-        return xs[i][j]
-    except IndexError:
-        return None
+# The cell itself comes first, so it wins ties when flowing downhill.
+OFFSETS = [(0, 0), (0, 1), (1, 0), (-1, 0), (0, -1)]
 
 
-def neighbor_indexes(xs, i, j):
-    return [
-        (i + dx, j + dy)
-        for (dx, dy) in [(0, 1), (1, 0), (-1, 0), (0, -1), (0, 0)]
-        if safe_index(xs, i + dx, j + dy) is not None
-    ]
+def parse(file):
+    return parse_grid(file.read())
 
 
-def neighbors(xs, i, j):
-    return [xs[a][b] for (a, b) in neighbor_indexes(xs, i, j)]
+def neighbors(xs):
+    """Heights of every cell and its neighbours, shape (5, h, w)."""
+    return np.stack(stencil(xs, OFFSETS, fill=10))
 
 
 def part1(file):
     xs = parse(file)
-    n = 0
-    for i, row in enumerate(xs):
-        for j, x in enumerate(row):
-            nb = neighbors(xs, i, j)
-
-            local_max = max(nb)
-            if local_max == x:
-                continue
-
-            local_min = min(nb)
+    nb = neighbors(xs)
 
-            if x == local_min:
-                n += x + 1
-                print(i, j, x, local_min)
-    return n
+    low = xs < nb[1:].min(axis=0)
+    return int((xs[low].astype(int) + 1).sum())
     # 1756: too high
     # 566
 
 
 def part2(file):
     xs = parse(file)
-    basins = defaultdict(int)
-
-    @cache
-    def basin(i, j):
-        if xs[i][j] == 9:
-            return None
-        this = xs[i][j]
-        flow_to = min(neighbors(xs, i, j))
-        if this == flow_to:
-            return (i, j)
-
-        sink = next(
-            (a, b) for (a, b) in neighbor_indexes(xs, i, j) if xs[a][b] == flow_to
-        )
-        return basin(*sink)
-
-    for i, row in enumerate(xs):
-        for j, _ in enumerate(row):
-            x = basin(i, j)
-            basins[x] += 1
-
-    del basins[None]
-    largest = [
-        v
-        for k, v in sorted(
-            basins.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )
-    ][:3]
-    return reduce(mul, largest)
+    h, w = xs.shape
+    nb = neighbors(xs)
+
+    # Every cell flows to its lowest neighbour, follow that until it stops.
+    flow = nb.argmin(axis=0)
+    di = np.array([di for di, dj in OFFSETS])[flow]
+    dj = np.array([dj for di, dj in OFFSETS])[flow]
+    i, j = np.indices(xs.shape)
+    sink = ((i + di) * w + (j + dj)).ravel()
+    while not (sink[sink] == sink).all():
+        sink = sink[sink]
+
+    basins = np.bincount(sink[xs.ravel() != 9], minlength=h * w)
+    largest = np.sort(basins)[::-1][:3]
+    return reduce(mul, (int(x) for x in largest))
 
 
 def getopts():
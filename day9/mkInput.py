@@ -0,0 +1,43 @@
+from argparse import ArgumentParser, FileType
+from sys import stdout
+from math import isqrt
+import random
+
+
+def getopts():
+    opts = ArgumentParser()
+    opts.add_argument("--output", "-o", type=FileType("w"), default=stdout)
+    opts.add_argument("--seed", "-s", type=int, default=None)
+    opts.add_argument("--size", "-n", type=int, default=1)
+    return opts.parse_args()
+
+
+def generate(size):
+    """
+    A heightmap with basins walled off by 9s, 100 by 100 at size 1, the area
+    growing with size.
+    """
+    side = isqrt(100 ** 2 * size)
+    walls_i = {i for i in range(side) if random.random() < 0.1}
+    walls_j = {j for j in range(side) if random.random() < 0.1}
+    for i in range(side):
+        yield "".join(
+            "9"
+            if i in walls_i or j in walls_j or random.random() < 0.05
+            else str(random.randint(0, 8))
+            for j in range(side)
+        )
+
+
+def main():
+    opts = getopts()
+
+    if opts.seed is not None:
+        random.seed(opts.seed)
+
+    for line in generate(opts.size):
+        print(line, file=opts.output)
+
+
+if __name__ == "__main__":
+    main()
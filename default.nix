@@ -28,7 +28,16 @@ let
       cd $src
       make | tee $out
     '';
+
+  # All days in one parallel in-process run, see common/runner.py
+  all = pkgs.runCommand "all.log" {
+    buildInputs = [ myPython ];
+  } ''
+    export PYTHONPATH="${common}:$PYTHONPATH"
+    cd ${src}
+    python -m common.runner | tee $out
+  '';
 in lib.listToAttrs (map (day: {
   name = day;
   value = mkDay day;
-}) days)
+}) days) // { inherit all; }